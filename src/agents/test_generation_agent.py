@@ -19,7 +19,7 @@ from src.models.test_plan_models import TestPlan
 from src.models.github_models import CodebaseAnalysis
 from src.models.jira_models import JiraTicket
 
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, log_cache_operation
 from src.utils.exceptions import WorkflowException
 
 # Import helper utilities
@@ -33,6 +33,9 @@ from src.utils.test_generation_utils import (
 
 logger = get_logger(__name__)
 
+# Shared across agent instances so parsed code structures survive between requests
+_cache_manager = CacheManager()
+
 class TestGenerationAgent:
     """
     Agent for generating E2E test cases with intelligent caching.
@@ -54,7 +57,7 @@ class TestGenerationAgent:
         self.github_client = GitHubClient(config)
 
         # Utilities
-        self.cache_manager = CacheManager()
+        self.cache_manager = _cache_manager
         self.naming_strategy = TestFileNamingStrategy()
         self.locator_extractor = LocatorExtractor()
         self.scope_detector = ScopeDetector()
@@ -173,6 +176,13 @@ class TestGenerationAgent:
         )
 
         cached_structure = self.cache_manager.get(cache_key)
+        log_cache_operation(
+            logger,
+            "code structure parsing",
+            cache_key=cache_key,
+            hit=cached_structure is not None,
+            cache_stats=self.cache_manager.stats()
+        )
         if cached_structure:
             return cached_structure
 
@@ -281,6 +291,7 @@ class TestGenerationAgent:
         # 3. Generate Code for Scenarios
         scenarios_generated = 0
         scenarios_skipped = 0
+        namer = self.naming_strategy.for_ticket(jira_ticket)
         
         for scenario in test_plan.test_scenarios:
             scenario_id_str = str(scenario.get('id', '')).lower()
@@ -290,11 +301,7 @@ class TestGenerationAgent:
                 scenarios_skipped += 1
                 continue
             
-            file_path = self.naming_strategy.generate_test_file_path(
-                ticket=jira_ticket, 
-                scenario=scenario,
-                test_type=scenario.get('test_type', 'e2e')
-            )
+            file_path = namer.path_for(scenario)
             
             file_path = self.naming_strategy.generate_unique_filename(
                 file_path, 
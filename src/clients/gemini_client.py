@@ -17,6 +17,19 @@ from src.utils.helpers import truncate_string
 
 logger = get_logger(__name__)
 
+# API key genai was last configured with; configure() rebuilds the SDK's
+# pooled clients, so it is only called again when the key changes
+_configured_api_key = None
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure the genai SDK once per API key so connections are reused"""
+    global _configured_api_key
+    if _configured_api_key != api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+        logger.debug("Configured google.generativeai SDK")
+
 class GeminiClient:
     """Client for Google Gemini AI integration"""
     
@@ -30,7 +43,7 @@ class GeminiClient:
         self.config = config
         
         try:
-            genai.configure(api_key=config.gemini.api_key)
+            _configure_genai(config.gemini.api_key)
 
             # Use models/gemini-1.5-flash or models/gemini-1.5-pro format
             model_name = config.gemini.model
@@ -450,6 +463,38 @@ Generate the test plan now:
         except Exception as e:
             raise GeminiClientException(f"Generation failed: {str(e)}")
 
+    async def generate_async(self, prompt: str) -> str:
+        """
+        Async text generation method that streams the response
+
+        Chunks are collected as they arrive so the event loop is free while
+        Gemini is still producing output.
+
+        Args:
+            prompt: Input prompt for generation
+
+        Returns:
+            Generated text response
+
+        Raises:
+            GeminiClientException: If generation fails
+        """
+        try:
+            response = await self.model.generate_content_async(prompt, stream=True)
+
+            parts = []
+            async for chunk in response:
+                parts.append(chunk.text)
+            text = ''.join(parts)
+
+            if not text:
+                raise GeminiClientException("Empty response from Gemini")
+
+            return text
+
+        except Exception as e:
+            raise GeminiClientException(f"Generation failed: {str(e)}")
+
     def analyze_test_failure(self, failure_details: Dict[str, Any]) -> Dict[str, Any]:
         """
         Use Gemini to analyze test failures and suggest fixes
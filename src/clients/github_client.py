@@ -96,15 +96,20 @@ class GitHubClient:
         # Detect Git service type
         self.git_service = self._detect_git_service()
         
-        # Initialize cache
+        # Initialize cache (shared instance, bounded by config limits)
         self.cache = get_cache() if enable_cache else None
+        cache_config = getattr(config, 'cache', None)
+        if self.cache and cache_config:
+            self.cache.resize(cache_config.max_entries, cache_config.max_size_mb, cache_config.default_ttl)
+            if cache_config.index_path:
+                self.cache.attach_index(cache_config.index_path)
         
         # Create session with retry logic
         self.session = self._create_session_with_retries()
         
         logger.info(f"GitHubClient initialized for: {self.owner}/{self.repo} ({self.git_service})")
         if self.cache:
-            logger.info(f"✅ Caching ENABLED - TTL: {cache_ttl}s")
+            logger.info(f"✅ Caching ENABLED - TTL: {self.cache.default_ttl}s")
     
     def _create_session_with_retries(self):
         """Create a requests session with retry logic"""
@@ -1018,6 +1023,12 @@ class GitHubClient:
             return None
         return self.cache.get_file_content(self.repo, branch, file_path)
     
+    def get_cached_file_contents(self, branch: str, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        """Get cached content of several files with one branch lookup"""
+        if not self.cache:
+            return dict.fromkeys(file_paths)
+        return self.cache.get_file_contents(self.repo, branch, file_paths)
+    
     def get_cached_file_diff(self, branch: str, file_path: str) -> Optional[str]:
         """Get cached diff of specific file"""
         if not self.cache:
@@ -8,16 +8,26 @@ NEW METHODS ADDED:
 - get_all_files_as_json() - Get all files as JSON string
 """
 
+import atexit
+import copy
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import json
+import os
+import pickle
 from pathlib import Path
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Changes are written to the pickle index at most once per this many seconds,
+# from a background thread, and once more at interpreter exit
+_INDEX_SAVE_DELAY_SECONDS = 30.0
+
 
 @dataclass
 class CachedFile:
@@ -118,22 +128,51 @@ class CachedAnalysis:
     cached_at: datetime = field(default_factory=datetime.now)
     ttl_seconds: int = 3600  # 1 hour default
     
+    # Memoized result of total_content_size_mb(), reset by add_file()
+    _content_size_mb: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
     def is_expired(self) -> bool:
         """Check if cache entry has expired"""
         age = datetime.now() - self.cached_at
         return age.total_seconds() > self.ttl_seconds
     
     def total_content_size_mb(self) -> float:
-        """Calculate total cached content size in MB"""
-        total_bytes = 0
-        for file in self.files.values():
-            if file.content:
-                total_bytes += len(file.content.encode('utf-8'))
-            if file.original_content:
-                total_bytes += len(file.original_content.encode('utf-8'))
-            if file.diff:
-                total_bytes += len(file.diff.encode('utf-8'))
-        return total_bytes / (1024 * 1024)
+        """
+        Calculate total cached content size in MB
+        
+        Encoding every file is proportional to the cached payload, so the
+        result is computed once; files must be changed through add_file(),
+        which resets it.
+        """
+        if self._content_size_mb is None:
+            total_bytes = 0
+            for file in self.files.values():
+                if file.content:
+                    total_bytes += len(file.content.encode('utf-8'))
+                if file.original_content:
+                    total_bytes += len(file.original_content.encode('utf-8'))
+                if file.diff:
+                    total_bytes += len(file.diff.encode('utf-8'))
+            self._content_size_mb = total_bytes / (1024 * 1024)
+        return self._content_size_mb
+    
+    def add_file(self, cached_file: CachedFile) -> None:
+        """
+        Add or replace a file, keeping the totals and the size memo in step
+        
+        Args:
+            cached_file: File to store under its path
+        """
+        previous = self.files.get(cached_file.path)
+        if previous is not None:
+            self.total_additions -= previous.additions
+            self.total_deletions -= previous.deletions
+        
+        self.files[cached_file.path] = cached_file
+        self.total_files = len(self.files)
+        self.total_additions += cached_file.additions
+        self.total_deletions += cached_file.deletions
+        self._content_size_mb = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary"""
@@ -188,7 +227,13 @@ class GitHubClientCache:
         files_by_status = cache.get_files_by_status(repo, branch, 'modified')
     """
     
-    def __init__(self, max_entries: int = 50, max_size_mb: int = 500, default_ttl: int = 3600):
+    def __init__(
+        self,
+        max_entries: int = 50,
+        max_size_mb: int = 500,
+        default_ttl: int = 3600,
+        index_path: Optional[str] = None
+    ):
         """
         Initialize cache
         
@@ -196,20 +241,28 @@ class GitHubClientCache:
             max_entries: Maximum number of analyses to cache (LRU eviction)
             max_size_mb: Maximum total content size before LRU cleanup
             default_ttl: Default TTL in seconds
+            index_path: Optional pickle file to persist the cache across runs
         """
-        self.cache: Dict[str, CachedAnalysis] = {}
+        # Ordered least -> most recently used; hits move entries to the end
+        self.cache: 'OrderedDict[str, CachedAnalysis]' = OrderedDict()
         self.max_entries = max_entries
         self.max_size_mb = max_size_mb
         self.default_ttl = default_ttl
         
-        # Access tracking for LRU
-        self.access_times: Dict[str, datetime] = {}
-        
         # Statistics
         self.hit_count = 0
         self.miss_count = 0
+        self.eviction_count = 0
         self.current_size_mb = 0.0
         
+        # Persistence (disabled unless an index path is attached)
+        self.index_path: Optional[str] = None
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        if index_path:
+            self.attach_index(index_path)
+        
         logger.info(f"✅ GitHubClientCache initialized")
         logger.info(f"   Max entries: {max_entries}")
         logger.info(f"   Max size: {max_size_mb}MB")
@@ -220,21 +273,114 @@ class GitHubClientCache:
         return f"{repository}:{branch}"
     
     def _evict_lru(self):
-        """Evict least recently used entry if cache is full"""
-        if len(self.cache) >= self.max_entries or self.current_size_mb >= self.max_size_mb:
-            if self.access_times:
-                # Find LRU key
-                lru_key = min(self.access_times.keys(), key=self.access_times.get)
-                
-                # Remove from cache
-                if lru_key in self.cache:
-                    removed_size = self.cache[lru_key].total_content_size_mb()
-                    del self.cache[lru_key]
-                    self.current_size_mb -= removed_size
-                    
-                del self.access_times[lru_key]
-                
-                logger.info(f"⚠️  LRU evicted: {lru_key} (freed {removed_size:.2f}MB)")
+        """Evict the least recently used entry"""
+        lru_key, analysis = self.cache.popitem(last=False)
+        removed_size = analysis.total_content_size_mb()
+        self.current_size_mb -= removed_size
+        self.eviction_count += 1
+        
+        logger.info(f"⚠️  LRU evicted: {lru_key} (freed {removed_size:.2f}MB)")
+    
+    def resize(self, max_entries: int, max_size_mb: int, default_ttl: Optional[int] = None) -> None:
+        """
+        Change cache limits, evicting LRU entries that no longer fit
+        
+        Args:
+            max_entries: Maximum number of analyses to cache
+            max_size_mb: Maximum total content size
+            default_ttl: TTL in seconds for analyses cached from now on (unchanged if None)
+        """
+        self.max_entries = max_entries
+        self.max_size_mb = max_size_mb
+        if default_ttl is not None:
+            self.default_ttl = default_ttl
+        while self.cache and (len(self.cache) > max_entries or self.current_size_mb > max_size_mb):
+            self._evict_lru()
+    
+    def attach_index(self, index_path: str) -> None:
+        """
+        Persist the cache to a pickle index file, loading it if it exists
+        
+        The index is only ever written by this cache, so it is trusted input
+        for pickle. Expired entries are dropped on load. Changes are saved in
+        the background shortly after they are made, and at interpreter exit.
+        
+        Args:
+            index_path: Path of the pickle index file
+        """
+        if self.index_path == index_path:
+            return
+        if self.index_path is None:
+            atexit.register(self.save_index)
+        self.index_path = index_path
+        self._load_index()
+    
+    def _load_index(self) -> None:
+        """Load cached analyses from the pickle index"""
+        path = Path(self.index_path)
+        if not path.exists():
+            return
+        
+        try:
+            with open(path, 'rb') as f:
+                entries = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load cache index {path}: {e}")
+            return
+        
+        loaded = 0
+        for key, analysis in entries.items():
+            if key in self.cache or analysis.is_expired():
+                continue
+            self.cache[key] = analysis
+            self.current_size_mb += analysis.total_content_size_mb()
+            loaded += 1
+        
+        # Apply current limits to the restored entries
+        self.resize(self.max_entries, self.max_size_mb)
+        logger.info(f"✅ Loaded {loaded} cache entries from {path}")
+    
+    def _schedule_save(self) -> None:
+        """Save the index in the background after a delay, batching later changes"""
+        if not self.index_path:
+            return
+        
+        with self._save_lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(_INDEX_SAVE_DELAY_SECONDS, self.save_index)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def save_index(self) -> None:
+        """Write the cache to the pickle index now (atomic rename)"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        if not self.index_path:
+            return
+        
+        # Only the timer bookkeeping holds _save_lock, so scheduling a save never
+        # waits for a write in progress
+        with self._write_lock:
+            # Entries and their file maps are copied so requests can keep
+            # changing the cache while the snapshot is pickled
+            snapshot = OrderedDict()
+            for key, analysis in list(self.cache.items()):
+                entry = copy.copy(analysis)
+                entry.files = dict(analysis.files)
+                snapshot[key] = entry
+            
+            path = Path(self.index_path)
+            tmp_path = path.with_name(path.name + '.tmp')
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"⚠️  Could not save cache index {path}: {e}")
     
     def set_analysis(
         self,
@@ -274,21 +420,72 @@ class GitHubClientCache:
             ttl_seconds=self.default_ttl
         )
         
-        # Check if we need to evict
-        analysis_size = analysis.total_content_size_mb()
-        if self.current_size_mb + analysis_size >= self.max_size_mb:
-            self._evict_lru()
+        # Replacing an entry must release its size before the limits are checked
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self.current_size_mb -= previous.total_content_size_mb()
         
-        # Store in cache
-        self.cache[key] = analysis
-        self.access_times[key] = datetime.now()
-        self.current_size_mb += analysis_size
+        analysis_size = self._store(key, analysis)
         
         logger.info(f"✅ Cached analysis: {key}")
         logger.info(f"   Files: {len(files)}")
         logger.info(f"   Size: {analysis_size:.2f}MB")
         logger.info(f"   Cache size: {self.current_size_mb:.2f}MB / {self.max_size_mb}MB")
     
+    def add_files(
+        self,
+        repository: str,
+        branch: str,
+        files: List['CachedFile'],
+        commit_id: str = "latest"
+    ) -> None:
+        """
+        Add files to the cached analysis of a branch, creating it if needed
+        
+        Unlike set_analysis, files already cached for the branch are kept.
+        
+        Args:
+            repository: Repository name
+            branch: Branch name
+            files: CachedFile objects to add or replace
+            commit_id: Commit SHA used if a new analysis is created
+        """
+        key = self._make_key(repository, branch)
+        
+        # The entry is re-stored below, so its size is released first
+        analysis = self.cache.pop(key, None)
+        if analysis is not None:
+            self.current_size_mb -= analysis.total_content_size_mb()
+            if analysis.is_expired():
+                analysis = None
+        if analysis is None:
+            analysis = CachedAnalysis(
+                repository=repository,
+                branch=branch,
+                commit_id=commit_id,
+                ttl_seconds=self.default_ttl
+            )
+        
+        for cached_file in files:
+            analysis.add_file(cached_file)
+        
+        self._store(key, analysis)
+        logger.info(f"✅ Added {len(files)} files to cached analysis: {key}")
+    
+    def _store(self, key: str, analysis: CachedAnalysis) -> float:
+        """Store an analysis as most recently used, evicting LRU entries to fit it"""
+        analysis_size = analysis.total_content_size_mb()
+        while self.cache and (
+            len(self.cache) >= self.max_entries or
+            self.current_size_mb + analysis_size > self.max_size_mb
+        ):
+            self._evict_lru()
+        
+        self.cache[key] = analysis
+        self.current_size_mb += analysis_size
+        self._schedule_save()
+        return analysis_size
+    
     def get_analysis(self, repository: str, branch: str) -> Optional[CachedAnalysis]:
         """
         Retrieve cached analysis
@@ -302,24 +499,22 @@ class GitHubClientCache:
         """
         key = self._make_key(repository, branch)
         
-        if key not in self.cache:
+        analysis = self.cache.get(key)
+        if analysis is None:
             self.miss_count += 1
             logger.debug(f"❌ Cache miss: {key}")
             return None
         
-        analysis = self.cache[key]
-        
         # Check expiration
         if analysis.is_expired():
             logger.warning(f"⏰ Cache expired: {key}")
             del self.cache[key]
-            del self.access_times[key]
             self.current_size_mb -= analysis.total_content_size_mb()
             self.miss_count += 1
             return None
         
-        # Update access time for LRU
-        self.access_times[key] = datetime.now()
+        # Mark as most recently used
+        self.cache.move_to_end(key)
         self.hit_count += 1
         
         logger.debug(f"✅ Cache hit: {key}")
@@ -359,6 +554,34 @@ class GitHubClientCache:
         cached_file = self.get_file(repository, branch, file_path)
         return cached_file.content if cached_file else None
     
+    def get_file_contents(
+        self,
+        repository: str,
+        branch: str,
+        file_paths: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get contents of several files with a single cache lookup
+        
+        Args:
+            repository: Repository name
+            branch: Branch name
+            file_paths: Paths to files
+        
+        Returns:
+            Dictionary of {file_path: content}, None for files not cached
+        """
+        analysis = self.get_analysis(repository, branch)
+        if not analysis:
+            return dict.fromkeys(file_paths)
+        
+        files = analysis.files
+        contents = {}
+        for path in file_paths:
+            cached_file = files.get(path)
+            contents[path] = cached_file.content if cached_file else None
+        return contents
+    
     def get_file_diff(self, repository: str, branch: str, file_path: str) -> Optional[str]:
         """
         Get diff of a specific file from cache
@@ -546,8 +769,8 @@ class GitHubClientCache:
         size = analysis.total_content_size_mb()
         
         del self.cache[key]
-        del self.access_times[key]
         self.current_size_mb -= size
+        self._schedule_save()
         
         logger.info(f"❌ Cache invalidated: {key} (freed {size:.2f}MB)")
         return True
@@ -555,8 +778,8 @@ class GitHubClientCache:
     def clear(self) -> None:
         """Clear entire cache"""
         self.cache.clear()
-        self.access_times.clear()
         self.current_size_mb = 0.0
+        self._schedule_save()
         logger.info("🗑️  Cache cleared completely")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -573,6 +796,7 @@ class GitHubClientCache:
             "max_content_size_mb": self.max_size_mb,
             "hit_count": self.hit_count,
             "miss_count": self.miss_count,
+            "eviction_count": self.eviction_count,
             "hit_rate_percent": f"{hit_rate:.1f}%",
             "entries": list(self.cache.keys()),
             "entries_detail": {
@@ -64,6 +64,14 @@ class TestRepoConfig:
         if '/' not in self.repo_url:
             raise ValueError("TEST_REPO_URL must be in format 'org/repo'")
 
+@dataclass
+class CacheConfig:
+    """GitHub analysis cache configuration"""
+    max_entries: int = 50
+    max_size_mb: int = 500
+    default_ttl: int = 3600
+    index_path: Optional[str] = None  # pickle file to persist the cache; disabled if unset
+
 @dataclass
 class ServerConfig:
     """Webhook server configuration"""
@@ -115,6 +123,13 @@ class Config:
             workers=int(os.getenv('WORKERS', '4'))
         )
 
+        self.cache = CacheConfig(
+            max_entries=int(os.getenv('CACHE_MAX_ENTRIES', '50')),
+            max_size_mb=int(os.getenv('CACHE_MAX_SIZE_MB', '500')),
+            default_ttl=int(os.getenv('CACHE_TTL', '3600')),
+            index_path=os.getenv('CACHE_INDEX_PATH') or None
+        )
+
         self.gcp_project_id = os.getenv('GCP_PROJECT_ID')
     
     def validate(self) -> bool:
@@ -162,6 +177,6 @@ class Config:
         }
 
 # config/__init__.py
-from .settings import Config, JiraConfig, GitHubConfig, GeminiConfig, EmailConfig, TestRepoConfig, ServerConfig
+from .settings import Config, JiraConfig, GitHubConfig, GeminiConfig, EmailConfig, TestRepoConfig, CacheConfig, ServerConfig
 
-__all__ = ['Config', 'JiraConfig', 'GitHubConfig', 'GeminiConfig', 'EmailConfig', 'TestRepoConfig', 'ServerConfig']
\ No newline at end of file
+__all__ = ['Config', 'JiraConfig', 'GitHubConfig', 'GeminiConfig', 'EmailConfig', 'TestRepoConfig', 'CacheConfig', 'ServerConfig']
\ No newline at end of file
@@ -51,8 +51,8 @@ class AttachTestPlanResponse(BaseModel):
                 "status": "success",
                 "message": "Test plan documents attached successfully to PROJ-102",
                 "attached_files": [
-                    "TestPlan_PROJ-102_20231201_120000.pdf",
-                    "TestPlan_PROJ-102_20231201_120000.xlsx"
+                    "TestPlan_PROJ-102_3f9c2a1b7e4d6058.pdf",
+                    "TestPlan_PROJ-102_3f9c2a1b7e4d6058.xlsx"
                 ],
                 "jira_comment_id": "12345"
             }
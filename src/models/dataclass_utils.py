@@ -0,0 +1,47 @@
+# ==============================================
+# Shared helpers for dataclass models
+# ==============================================
+
+from dataclasses import fields, MISSING
+from typing import Dict, Any
+
+
+class FromDictMixin:
+    """
+    Adds a from_dict constructor to a dataclass
+
+    Subclasses set _FIELDS (the keys read from the payload) and, once the
+    dataclass is built, _DEFAULTS (see from_dict_defaults).
+    """
+    # Keeps slots=True subclasses free of a per-instance __dict__
+    __slots__ = ()
+
+    _FIELDS = ()
+    _DEFAULTS = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Create an instance from dictionary data, filling missing fields with defaults"""
+        kwargs = {}
+        for k in cls._FIELDS:
+            if k in data:
+                kwargs[k] = data[k]
+            else:
+                default = cls._DEFAULTS[k]
+                kwargs[k] = default() if callable(default) else default
+        return cls(**kwargs)
+
+
+def from_dict_defaults(cls, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Defaults used by from_dict, taken from the dataclass fields; callables are
+    used as factories so mutable defaults are never shared between instances
+    """
+    defaults = {}
+    for f in fields(cls):
+        if f.default is not MISSING:
+            defaults[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            defaults[f.name] = f.default_factory
+    defaults.update(overrides)
+    return defaults
@@ -5,9 +5,10 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
+from src.models.dataclass_utils import FromDictMixin, from_dict_defaults
 
-@dataclass
-class JiraTicket:
+@dataclass(slots=True)
+class JiraTicket(FromDictMixin):
     """Jira ticket data model"""
     key: str
     summary: str
@@ -30,7 +31,15 @@ class JiraTicket:
     epic_name: Optional[str] = None  # Epic name for grouping
     subtasks: List[str] = field(default_factory=list)  # List of subtask keys
     is_subtask: bool = False  # Whether this is a subtask
-    
+
+    # Fields read by from_dict; their defaults (_DEFAULTS) are derived from the
+    # dataclass fields once the class is built, below
+    _FIELDS = (
+        'key', 'summary', 'description', 'story_type', 'acceptance_criteria',
+        'components', 'linked_issues', 'assignee', 'status', 'priority',
+        'reporter', 'labels'
+    )
+
     def has_acceptance_criteria(self) -> bool:
         """Check if ticket has acceptance criteria"""
         return len(self.acceptance_criteria) > 0
@@ -94,4 +103,18 @@ class JiraTicket:
             'epic_name': self.epic_name,
             'subtasks': self.subtasks,
             'is_subtask': self.is_subtask
-        }
\ No newline at end of file
+        }
+
+
+# Required fields fall back to empty values, and story_type to "Story"
+JiraTicket._DEFAULTS = from_dict_defaults(JiraTicket, {
+    'key': '',
+    'summary': '',
+    'description': '',
+    'story_type': 'Story',
+    'acceptance_criteria': list,
+    'components': list,
+    'linked_issues': list,
+    'assignee': '',
+    'status': '',
+})
@@ -5,6 +5,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from src.models.github_models import RepositoryConfig
+from src.models.dataclass_utils import FromDictMixin, from_dict_defaults
 import re
 
 @dataclass
@@ -29,8 +30,8 @@ class TestScenario:
             'test_type': self.test_type
         }
 
-@dataclass
-class TestPlan:
+@dataclass(slots=True)
+class TestPlan(FromDictMixin):
     """Generated test plan"""
     # Required fields from your payload
     jira_ticket: str
@@ -50,6 +51,14 @@ class TestPlan:
     generated_at: Optional[str] = None
     quality_issues: List[str] = field(default_factory=list)
 
+    # Fields read by from_dict; their defaults (_DEFAULTS) are derived from the
+    # dataclass fields once the class is built, below
+    _FIELDS = (
+        'jira_ticket', 'strategy', 'test_approach', 'testable_components',
+        'test_scenarios', 'traceability_matrix', 'coverage_targets',
+        'confidence_score', 'environment_config', 'generated_at', 'quality_issues'
+    )
+
     def __post_init__(self):
         """Clean up confidence_score after initialization"""
         if isinstance(self.confidence_score, str):
@@ -82,4 +91,14 @@ class TestPlan:
             'traceability_matrix': self.traceability_matrix,
             'coverage_targets': self.coverage_targets,
             'confidence_score': self.confidence_score
-        }
\ No newline at end of file
+        }
+
+
+# Required fields fall back to empty values. test_approach falls back to ''
+# rather than its "BDD" field default: the review and attach services built
+# plans with .get('test_approach', ''), and from_dict keeps their output unchanged
+TestPlan._DEFAULTS = from_dict_defaults(TestPlan, {
+    'jira_ticket': '',
+    'test_scenarios': list,
+    'test_approach': '',
+})
@@ -209,6 +209,7 @@ async def gather_response_for_generate_tests(
         all_files_content = github_client.get_all_files_in_branch(target_app_branch)
         
         files_list = []
+        cached_files = []
         for path, content in all_files_content.items():
             files_list.append({
                 "path": path,
@@ -220,28 +221,18 @@ async def gather_response_for_generate_tests(
             
             # CRITICAL: Pre-populate the cache for the agent to find the content
             if github_client.cache:
-                from src.clients.github_client_cache import CachedFile, CachedAnalysis
-                import datetime
+                from src.clients.github_client_cache import CachedFile
                 
-                cached_file = CachedFile(
+                cached_files.append(CachedFile(
                     path=path,
                     status="existing",
                     content=content,
                     file_size_bytes=len(content) if content else 0
-                )
-                
-                cache_key = f"{github_client.repo}:{target_app_branch}"
-                if cache_key not in github_client.cache.cache:
-                     analysis = CachedAnalysis(
-                         repository=github_client.repo,
-                         branch=target_app_branch,
-                         commit_id="latest",
-                         files={}
-                     )
-                     github_client.cache.cache[cache_key] = analysis
-                     github_client.cache.access_times[cache_key] = datetime.datetime.now()
-                
-                github_client.cache.cache[cache_key].files[path] = cached_file
+                ))
+        
+        # Added through the cache API so size accounting, eviction and persistence apply
+        if cached_files:
+            github_client.cache.add_files(github_client.repo, target_app_branch, cached_files)
 
         logger.info(f"[{jira_ticket_key}] Successfully fetched and cached {len(files_list)} files.")
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 
 from src.models.review_test_plan_models import ReviewTestPlanRequest, ReviewTestPlanResponse
@@ -47,18 +48,18 @@ async def review_test_plan(
         # Call the service
         result = await review_and_enhance_test_plan(request_data)
         
-        # Convert back to response model
-        response = ReviewTestPlanResponse(**result)
-        
-        if response.status == "error":
-            logger.error(f"Test plan review failed: {response.message}")
+        if result.get("status") == "error":
+            logger.error(f"Test plan review failed: {result.get('message')}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=response.message
+                detail=result.get("message")
             )
         
-        logger.info(f"Test plan review completed successfully: {response.scenarios_added} scenarios added")
-        return response
+        logger.info(f"Test plan review completed successfully: {result.get('scenarios_added', 0)} scenarios added")
+        
+        # Result was already built from ReviewTestPlanResponse by the service,
+        # so serialize it directly instead of re-validating it through the model
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -100,19 +100,7 @@ class AttachTestPlanService:
 
     def _create_test_plan_object(self, jira_ticket_key: str, test_plan_data: Dict[str, Any]) -> TestPlan:
         """Create TestPlan object from dictionary data"""
-        return TestPlan(
-            jira_ticket=jira_ticket_key,
-            strategy=test_plan_data.get('strategy', ''),
-            test_approach=test_plan_data.get('test_approach', ''),
-            testable_components=test_plan_data.get('testable_components', []),
-            test_scenarios=test_plan_data.get('test_scenarios', []),
-            traceability_matrix=test_plan_data.get('traceability_matrix', {}),
-            coverage_targets=test_plan_data.get('coverage_targets', {}),
-            confidence_score=test_plan_data.get('confidence_score', 0.0),
-            environment_config=test_plan_data.get('environment_config'),
-            generated_at=test_plan_data.get('generated_at'),
-            quality_issues=test_plan_data.get('quality_issues', [])
-        )
+        return TestPlan.from_dict({**test_plan_data, 'jira_ticket': jira_ticket_key})
 
     def _attach_files_to_jira(self, jira_client: JiraClient, jira_ticket_key: str, documents: Dict[str, str]) -> List[str]:
         """Attach generated files to Jira ticket using existing Jira client"""
@@ -1,4 +1,5 @@
 from typing import Dict, Any, List, Tuple
+import asyncio
 import json
 import re
 
@@ -12,6 +13,60 @@ from src.config.settings import Config
 
 logger = get_logger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Quality issue messages that _enhance_test_plan tracks by identity
+_MISSING_API_ISSUE = "Missing API test scenarios"
+_MISSING_E2E_ISSUE = "Missing E2E test scenarios"
+_NO_HIGH_PRIORITY_ISSUE = "No High priority scenarios - critical functionality may be untested"
+
+# Prompt used to ask Gemini for additional scenarios; filled in with str.format
+_ENHANCEMENT_PROMPT_TEMPLATE = """You are a QE expert enhancing a test plan that has quality issues.
+
+JIRA TICKET: {ticket_key} - {ticket_summary}
+
+Acceptance Criteria:
+{acceptance_criteria}
+
+Description:
+{description}
+
+QUALITY ISSUES TO ADDRESS:
+{quality_issues}
+
+CURRENT SCENARIOS ({scenario_count} total):
+{scenario_summary}
+
+YOUR TASK:
+Generate 5-10 additional test scenarios to address the quality issues above.
+
+Focus on:
+1. Missing test types (API/E2E)
+2. Acceptance criteria with insufficient coverage
+3. Edge cases and boundary conditions
+4. Negative test scenarios
+
+RETURN ONLY VALID JSON (no markdown):
+{{
+  "additional_scenarios": [
+    {{
+      "id": "TS-{next_id:03d}",
+      "title": "Clear, specific title",
+      "given": "Detailed preconditions",
+      "when": "Specific action",
+      "then": "Specific expected outcome", 
+      "priority": "High|Medium|Low",
+      "test_type": "API|E2E"
+    }}
+  ],
+  "traceability_updates": {{
+    "Full acceptance criterion text": ["TS-{next_id:03d}"]
+  }}
+}}
+
+CRITICAL: Return ONLY the JSON object above. No markdown, no explanations.
+"""
+
 class ReviewTestPlanService:
     """
     Service for reviewing and enhancing test plans using AI
@@ -76,7 +131,7 @@ class ReviewTestPlanService:
             # Step 3: Enhance if issues found
             if quality_issues:
                 logger.info("Enhancing test plan to address quality issues")
-                enhanced_plan = self._enhance_test_plan(
+                enhanced_plan = await self._enhance_test_plan(
                     test_plan, 
                     jira_ticket, 
                     quality_issues, 
@@ -128,36 +183,11 @@ class ReviewTestPlanService:
 
     def _create_test_plan_object(self, test_plan_data: Dict[str, Any]) -> TestPlan:
         """Create TestPlan object from dictionary data"""
-        return TestPlan(
-            jira_ticket=test_plan_data.get('jira_ticket', ''),
-            strategy=test_plan_data.get('strategy', ''),
-            test_approach=test_plan_data.get('test_approach', ''),
-            testable_components=test_plan_data.get('testable_components', []),
-            test_scenarios=test_plan_data.get('test_scenarios', []),
-            traceability_matrix=test_plan_data.get('traceability_matrix', {}),
-            coverage_targets=test_plan_data.get('coverage_targets', {}),
-            confidence_score=test_plan_data.get('confidence_score', 0.0),
-            environment_config=test_plan_data.get('environment_config'),
-            generated_at=test_plan_data.get('generated_at'),
-            quality_issues=test_plan_data.get('quality_issues', [])
-        )
+        return TestPlan.from_dict(test_plan_data)
 
     def _create_jira_ticket_object(self, jira_ticket_data: Dict[str, Any]) -> JiraTicket:
         """Create JiraTicket object from dictionary data"""
-        return JiraTicket(
-            key=jira_ticket_data.get('key', ''),
-            summary=jira_ticket_data.get('summary', ''),
-            description=jira_ticket_data.get('description', ''),
-            story_type=jira_ticket_data.get('story_type', 'Story'),
-            acceptance_criteria=jira_ticket_data.get('acceptance_criteria', []),
-            components=jira_ticket_data.get('components', []),
-            linked_issues=jira_ticket_data.get('linked_issues', []),
-            assignee=jira_ticket_data.get('assignee', ''),
-            status=jira_ticket_data.get('status', ''),
-            priority=jira_ticket_data.get('priority', 'Medium'),
-            reporter=jira_ticket_data.get('reporter', ''),
-            labels=jira_ticket_data.get('labels', [])
-        )
+        return JiraTicket.from_dict(jira_ticket_data)
 
     def _validate_quality(
         self,
@@ -176,61 +206,90 @@ class ReviewTestPlanService:
         Returns:
             List of quality issues (empty if no issues)
         """
-        issues = []
+        issues = self._check_count(scenarios, traceability)
+        issues += self._check_per_ac(traceability)
+        
+        # 3-5. Type coverage, priority distribution and completeness in a single
+        # pass; the per-check helpers below are only for the enhancement loop
+        test_types = set()
+        has_high_priority = False
+        incomplete_count = 0
+        for scenario in scenarios:
+            test_types.add(scenario.get('test_type', 'Unknown'))
+            
+            if scenario.get('priority', 'Medium') == 'High':
+                has_high_priority = True
+            
+            given = scenario.get('given')
+            then = scenario.get('then')
+            if (not given or not then or not scenario.get('when') or
+                    len(given) < 10 or len(then) < 10):
+                incomplete_count += 1
         
-        # Calculate expected minimum scenarios
-        ac_count = len(traceability.keys())
+        if 'API' not in test_types:
+            issues.append(_MISSING_API_ISSUE)
+        if 'E2E' not in test_types:
+            issues.append(_MISSING_E2E_ISSUE)
+        if not has_high_priority:
+            issues.append(_NO_HIGH_PRIORITY_ISSUE)
+        if incomplete_count:
+            issues.append(f"{incomplete_count} scenarios have incomplete Given/When/Then structure")
+        
+        logger.info(f"Quality validation complete: {len(issues)} issues found")
+        return issues
+
+    def _check_count(self, scenarios: List[Dict], traceability: Dict[str, List[str]]) -> List[str]:
+        """1. Scenario count check against the per-AC minimum"""
+        ac_count = len(traceability)
         expected_min = max(10, ac_count * 2)  # Reduced from original for practicality
         
-        # 1. Scenario count check
         if len(scenarios) < expected_min:
-            issues.append(
+            return [
                 f"Insufficient scenarios: {len(scenarios)} "
                 f"(minimum {expected_min} recommended for {ac_count} acceptance criteria)"
-            )
-        
-        # 2. Per-AC coverage check
-        for ac, scenario_ids in traceability.items():
-            if len(scenario_ids) < 2:
-                issues.append(
-                    f"Acceptance criterion '{ac[:50]}...' has only "
-                    f"{len(scenario_ids)} scenario(s) - recommend minimum 2"
-                )
-        
-        # 3. Test type coverage
-        test_types = [s.get('test_type', 'Unknown') for s in scenarios]
+            ]
+        return []
+
+    def _check_per_ac(self, traceability: Dict[str, List[str]]) -> List[str]:
+        """2. Per-AC coverage check"""
+        return [
+            f"Acceptance criterion '{ac[:50]}...' has only "
+            f"{len(scenario_ids)} scenario(s) - recommend minimum 2"
+            for ac, scenario_ids in traceability.items()
+            if len(scenario_ids) < 2
+        ]
+
+    def _check_types(self, scenarios: List[Dict]) -> List[str]:
+        """3. Test type coverage"""
+        test_types = {scenario.get('test_type', 'Unknown') for scenario in scenarios}
+        issues = []
         if 'API' not in test_types:
-            issues.append("Missing API test scenarios")
+            issues.append(_MISSING_API_ISSUE)
         if 'E2E' not in test_types:
-            issues.append("Missing E2E test scenarios")
-        
-        # 4. Priority distribution
-        priority_counts = {'High': 0, 'Medium': 0, 'Low': 0}
-        for s in scenarios:
-            priority = s.get('priority', 'Medium')
-            if priority in priority_counts:
-                priority_counts[priority] += 1
-        
-        if priority_counts['High'] == 0:
-            issues.append("No High priority scenarios - critical functionality may be untested")
-        
-        # 5. Scenario completeness
-        incomplete_scenarios = []
-        for scenario in scenarios:
-            if (not scenario.get('given') or 
-                not scenario.get('when') or 
-                not scenario.get('then') or
-                len(scenario.get('given', '')) < 10 or
-                len(scenario.get('then', '')) < 10):
-                incomplete_scenarios.append(scenario.get('id', 'unknown'))
-        
-        if incomplete_scenarios:
-            issues.append(f"{len(incomplete_scenarios)} scenarios have incomplete Given/When/Then structure")
-        
-        logger.info(f"Quality validation complete: {len(issues)} issues found")
+            issues.append(_MISSING_E2E_ISSUE)
         return issues
 
-    def _enhance_test_plan(
+    def _check_priority(self, scenarios: List[Dict]) -> List[str]:
+        """4. Priority distribution"""
+        if any(scenario.get('priority', 'Medium') == 'High' for scenario in scenarios):
+            return []
+        return [_NO_HIGH_PRIORITY_ISSUE]
+
+    def _check_completeness(self, scenarios: List[Dict]) -> List[str]:
+        """5. Scenario completeness"""
+        incomplete_count = 0
+        for scenario in scenarios:
+            given = scenario.get('given')
+            then = scenario.get('then')
+            if (not given or not then or not scenario.get('when') or
+                    len(given) < 10 or len(then) < 10):
+                incomplete_count += 1
+        
+        if incomplete_count:
+            return [f"{incomplete_count} scenarios have incomplete Given/When/Then structure"]
+        return []
+
+    async def _enhance_test_plan(
         self,
         test_plan: TestPlan,
         ticket: JiraTicket,
@@ -256,12 +315,17 @@ class ReviewTestPlanService:
         current_traceability = test_plan.traceability_matrix.copy()
         remaining_issues = quality_issues.copy()
         
+        # Adding scenarios can only satisfy the type and priority checks, never
+        # break them, so once they pass they are not re-run in later iterations
+        types_ok = _MISSING_API_ISSUE not in remaining_issues and _MISSING_E2E_ISSUE not in remaining_issues
+        priority_ok = _NO_HIGH_PRIORITY_ISSUE not in remaining_issues
+        
         while iteration < max_iterations and remaining_issues:
             iteration += 1
             logger.info(f"Enhancement iteration {iteration}/{max_iterations}")
             
             # Generate enhancements using AI
-            additional_scenarios, traceability_updates = self._generate_enhancements(
+            additional_scenarios, traceability_updates = await self._generate_enhancements(
                 current_scenarios,
                 current_traceability,
                 remaining_issues,
@@ -276,18 +340,35 @@ class ReviewTestPlanService:
             logger.info(f"Adding {len(additional_scenarios)} additional scenarios")
             current_scenarios.extend(additional_scenarios)
             
-            # Update traceability
+            # Update traceability (order-preserving, de-duplicated merge)
             if traceability_updates:
                 for key, scenario_ids in traceability_updates.items():
                     if key in current_traceability:
-                        existing = set(str(s) for s in current_traceability[key])
-                        new_ids = set(str(s) for s in scenario_ids)
-                        current_traceability[key] = list(existing | new_ids)
+                        existing = list(current_traceability[key])
+                        seen = {str(s) for s in existing}
+                        for scenario_id in scenario_ids:
+                            sid = str(scenario_id)
+                            if sid not in seen:
+                                seen.add(sid)
+                                existing.append(scenario_id)
+                        current_traceability[key] = existing
                     else:
                         current_traceability[key] = scenario_ids
             
-            # Re-validate to check if issues are resolved
-            remaining_issues = self._validate_quality(current_scenarios, current_traceability, ticket)
+            # Re-validate to check if issues are resolved. Count, per-AC and
+            # completeness can regress (new AC keys, incomplete scenarios) so
+            # they always run
+            remaining_issues = self._check_count(current_scenarios, current_traceability)
+            remaining_issues += self._check_per_ac(current_traceability)
+            if not types_ok:
+                type_issues = self._check_types(current_scenarios)
+                types_ok = not type_issues
+                remaining_issues += type_issues
+            if not priority_ok:
+                priority_issues = self._check_priority(current_scenarios)
+                priority_ok = not priority_issues
+                remaining_issues += priority_issues
+            remaining_issues += self._check_completeness(current_scenarios)
             if remaining_issues:
                 logger.info(f"Remaining quality issues after iteration {iteration}: {len(remaining_issues)}")
             else:
@@ -311,7 +392,7 @@ class ReviewTestPlanService:
         logger.info(f"Enhancement complete: {len(current_scenarios)} total scenarios")
         return enhanced_plan
 
-    def _generate_enhancements(
+    async def _generate_enhancements(
         self,
         current_scenarios: List[Dict],
         traceability: Dict[str, List[str]],
@@ -341,55 +422,22 @@ class ReviewTestPlanService:
         # Calculate next scenario ID
         next_id = len(current_scenarios) + 1
         
-        enhancement_prompt = f"""You are a QE expert enhancing a test plan that has quality issues.
-
-JIRA TICKET: {ticket.key} - {ticket.summary}
-
-Acceptance Criteria:
-{chr(10).join(['- ' + ac for ac in ticket.acceptance_criteria]) if ticket.acceptance_criteria else 'Infer from description'}
-
-Description:
-{ticket.description or 'No description available'}
-
-QUALITY ISSUES TO ADDRESS:
-{chr(10).join(['- ' + issue for issue in quality_issues[:8]])}
-
-CURRENT SCENARIOS ({len(current_scenarios)} total):
-{json.dumps(scenario_summary, indent=2)}
-
-YOUR TASK:
-Generate 5-10 additional test scenarios to address the quality issues above.
-
-Focus on:
-1. Missing test types (API/E2E)
-2. Acceptance criteria with insufficient coverage
-3. Edge cases and boundary conditions
-4. Negative test scenarios
-
-RETURN ONLY VALID JSON (no markdown):
-{{
-  "additional_scenarios": [
-    {{
-      "id": "TS-{next_id:03d}",
-      "title": "Clear, specific title",
-      "given": "Detailed preconditions",
-      "when": "Specific action",
-      "then": "Specific expected outcome", 
-      "priority": "High|Medium|Low",
-      "test_type": "API|E2E"
-    }}
-  ],
-  "traceability_updates": {{
-    "Full acceptance criterion text": ["TS-{next_id:03d}"]
-  }}
-}}
-
-CRITICAL: Return ONLY the JSON object above. No markdown, no explanations.
-"""
+        enhancement_prompt = _ENHANCEMENT_PROMPT_TEMPLATE.format(
+            ticket_key=ticket.key,
+            ticket_summary=ticket.summary,
+            acceptance_criteria=(
+                "\n".join(f"- {ac}" for ac in ticket.acceptance_criteria)
+                if ticket.acceptance_criteria else 'Infer from description'
+            ),
+            description=ticket.description or 'No description available',
+            quality_issues="\n".join(f"- {issue}" for issue in quality_issues[:8]),
+            scenario_count=len(current_scenarios),
+            scenario_summary=json.dumps(scenario_summary, indent=2),
+            next_id=next_id
+        )
         
         try:
-            # FIX: Call generate synchronously (without await)
-            response = self.gemini_client.generate(enhancement_prompt)
+            response = await self.gemini_client.generate_async(enhancement_prompt)
             
             # Parse response
             text = response.strip()
@@ -402,18 +450,23 @@ CRITICAL: Return ONLY the JSON object above. No markdown, no explanations.
             
             # Find JSON
             json_start = text.find('{')
-            json_end = text.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
+            if json_start == -1:
                 logger.error("No JSON found in enhancement response")
                 return [], {}
             
-            json_str = text[json_start:json_end]
-            
-            # Fix common JSON issues
-            json_str = self._fix_json_issues(json_str)
-            
-            data = json.loads(json_str)
+            try:
+                # Fast path: decode straight from the opening brace, ignoring trailing text
+                data, _ = _JSON_DECODER.raw_decode(text, json_start)
+            except json.JSONDecodeError:
+                json_end = text.rfind('}') + 1
+                if json_end == 0:
+                    logger.error("No JSON found in enhancement response")
+                    return [], {}
+                
+                # Fix common JSON issues
+                json_str = self._fix_json_issues(text[json_start:json_end])
+                
+                data = json.loads(json_str)
             
             additional_scenarios = data.get('additional_scenarios', [])
             traceability_updates = data.get('traceability_updates', {})
@@ -454,6 +507,7 @@ CRITICAL: Return ONLY the JSON object above. No markdown, no explanations.
 
 # Service instance (singleton pattern)
 _review_test_plan_service = None
+_init_lock = asyncio.Lock()
 
 async def review_and_enhance_test_plan(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -469,9 +523,12 @@ async def review_and_enhance_test_plan(request_data: Dict[str, Any]) -> Dict[str
     
     try:
         if _review_test_plan_service is None:
-            config = Config()
-            config.validate()
-            _review_test_plan_service = ReviewTestPlanService(config)
+            # Double-checked so concurrent first requests build only one service
+            async with _init_lock:
+                if _review_test_plan_service is None:
+                    config = Config()
+                    config.validate()
+                    _review_test_plan_service = ReviewTestPlanService(config)
         
         test_plan_data = request_data['test_plan']
         jira_ticket_data = request_data['jira_ticket']
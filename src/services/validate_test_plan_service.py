@@ -1,9 +1,44 @@
+import logging
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional
 from dateutil import parser as date_parser
 
+from src.utils.logger import get_logger
+
 load_dotenv()
 
+logger = get_logger(__name__)
+
+# File extensions used for generated test plan documents
+_TP_EXT = ('.pdf', '.xlsx')
+
+
+@lru_cache(maxsize=1024)
+def _parse_created(created: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an attachment 'created' timestamp into an aware UTC datetime
+
+    Jira emits ISO-8601, so the fast isoparse path is tried first and the
+    generic parser is only used for anything else. Naive timestamps are taken
+    as local time, so naive and timezone-aware values compare correctly.
+    Missing or unparsable timestamps give None.
+    """
+    if not created or not isinstance(created, str):
+        return None
+    try:
+        if 'T' in created:
+            try:
+                return date_parser.isoparse(created).astimezone(timezone.utc)
+            except ValueError:
+                pass
+        return date_parser.parse(created).astimezone(timezone.utc)
+    except (ValueError, OverflowError):
+        return None
+
+
 async def validate_existing_test_plan(input_params: dict
                                     #   , token: str
                                       ):
@@ -12,7 +47,6 @@ async def validate_existing_test_plan(input_params: dict
     If found and recent (< 7 days), validate and use it instead of regenerating
     """
     try:
-        logger = get_logger(__name__)
         logger.info("Checking for existing test plan...")
         
         attachments = input_params.get("attachments", [])
@@ -27,22 +61,14 @@ async def validate_existing_test_plan(input_params: dict
             }
         
         # Look for test plan attachments (PDF or Excel)
-        test_plan_attachments = []
-        for attachment in attachments:
-            filename = attachment.get('filename', '')
-            logger.info(f"Processing attachment: {filename}")
-            
-            if 'TestPlan' in filename and (
-                filename.endswith('.pdf') or 
-                filename.endswith('.xlsx')
-            ):
-                logger.info(f"Found test plan attachment: {filename}")
-                test_plan_attachments.append(attachment)
-            else:
-                logger.info(f"Skipped non-test plan attachment: {filename}")
+        test_plan_attachments = [
+            a for a in attachments
+            if 'TestPlan' in (fn := a.get('filename', '')) and fn.endswith(_TP_EXT)
+        ]
         
         logger.info(f"Found {len(test_plan_attachments)} test plan attachments")
         
+        # Nothing matched - skip date parsing and per-file logging entirely
         if not test_plan_attachments:
             logger.info("No test plan attachments found - will generate new one")
             return {
@@ -51,20 +77,29 @@ async def validate_existing_test_plan(input_params: dict
             }
         
         # Log details of each test plan attachment
-        for attachment in test_plan_attachments:
-            filename = attachment.get('filename', '')
-            created = attachment.get('created', '')
-            logger.info(f"Test plan file: {filename}, Created: {created}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for attachment in test_plan_attachments:
+                logger.debug(f"Test plan file: {attachment.get('filename', '')}, Created: {attachment.get('created', '')}")
         
         # Check if most recent test plan is recent enough (< 7 days)
-        most_recent = max(test_plan_attachments, key=lambda a: a.get('created', ''))
+        # Compare parsed dates rather than raw strings so mixed timezones order correctly;
+        # attachments without a usable date are skipped
+        dated = [
+            (created, a) for a in test_plan_attachments
+            if (created := _parse_created(a.get('created'))) is not None
+        ]
+        if not dated:
+            logger.info("No dated test plan attachments found - will generate new one")
+            return {
+                "status": "success",
+                "has_recent_test_plan": False
+            }
         
-        # Parse created date
-        created_date = date_parser.parse(most_recent.get('created'))
-        age_days = (datetime.now(created_date.tzinfo) - created_date).days
+        created_date, most_recent = max(dated, key=itemgetter(0))
+        age_days = (datetime.now(timezone.utc) - created_date).days
         
         logger.info(f"Most recent test plan: {most_recent.get('filename')}")
-        logger.info(f"Created: {created_date.strftime('%Y-%m-%d %H:%M:%S')} ({age_days} days ago)")
+        logger.info(f"Created: {created_date.strftime('%Y-%m-%d %H:%M:%S')} UTC ({age_days} days ago)")
         
         if age_days > 7:
             logger.info(f"Test plan is {age_days} days old (> 7 days) - will regenerate")
@@ -86,9 +121,3 @@ async def validate_existing_test_plan(input_params: dict
             "status": "error",
             "message": f"Internal processing error: {str(e)}"
         }
-
-def get_logger(name):
-    """Simple logger implementation"""
-    import logging
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    return logging.getLogger(name)
\ No newline at end of file
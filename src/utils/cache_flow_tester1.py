@@ -9,6 +9,7 @@ This class demonstrates all 3 steps:
 
 import sys
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # Fix paths
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -16,6 +17,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.clients.github_client import GitHubClient
 from src.config.settings import Config
 
+# Banner strings used by every step's output
+_SEP80 = "=" * 80
+_HR76 = "─" * 76
+_BOX_TOP = "╔" + "=" * 78 + "╗"
+_BOX_BOTTOM = "╚" + "=" * 78 + "╝"
+
 
 class CacheFlowTester:
     """
@@ -49,9 +56,9 @@ class CacheFlowTester:
         - Gets file diffs
         - Automatically caches everything
         """
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("STEP 1: FETCH CODEBASE FROM GITHUB")
-        print("="*80)
+        print(_SEP80)
         
         try:
             print(f"\n📝 Fetching codebase for branch: {branch}")
@@ -80,9 +87,9 @@ class CacheFlowTester:
         The analyze_codebase() method automatically caches content.
         We verify by checking cache statistics and getting cached files.
         """
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("STEP 2: VERIFY CACHE WAS POPULATED")
-        print("="*80)
+        print(_SEP80)
         
         try:
             # Get cache stats
@@ -124,9 +131,9 @@ class CacheFlowTester:
         Uses get_cached_files(branch) which returns all files with content
         for the given branch. The key is implicitly: {repo}:{branch}
         """
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("STEP 3: RETRIEVE CACHED CONTENT BY REPOSITORY:BRANCH")
-        print("="*80)
+        print(_SEP80)
         
         try:
             # Get repository from client
@@ -145,17 +152,19 @@ class CacheFlowTester:
             
             # Show files
             print(f"\n📝 Cached files:")
+            # One block per file, written to stdout in a single call
+            blocks = []
             for file_path, cached_file in cached_files.items():
-                content_length = len(cached_file.content or "")
-                diff_length = len(cached_file.diff or "")
-                
-                print(f"\n   File: {file_path}")
-                print(f"   ├─ Status: {cached_file.status}")
-                print(f"   ├─ Language: {cached_file.language}")
-                print(f"   ├─ Content: {content_length} characters")
-                print(f"   ├─ Diff: {diff_length} characters")
-                print(f"   ├─ Changes: +{cached_file.additions} -{cached_file.deletions}")
-                print(f"   └─ Hash: {cached_file.file_hash[:16]}...")
+                blocks.append(
+                    f"\n   File: {file_path}\n"
+                    f"   ├─ Status: {cached_file.status}\n"
+                    f"   ├─ Language: {cached_file.language}\n"
+                    f"   ├─ Content: {len(cached_file.content or '')} characters\n"
+                    f"   ├─ Diff: {len(cached_file.diff or '')} characters\n"
+                    f"   ├─ Changes: +{cached_file.additions} -{cached_file.deletions}\n"
+                    f"   └─ Hash: {cached_file.file_hash[:16]}...\n"
+                )
+            sys.stdout.write("".join(blocks))
             
             return True
             
@@ -175,54 +184,80 @@ class CacheFlowTester:
         
         Uses get_cached_file_content(branch, path) to get specific file content
         """
-        print("\n" + "="*80)
-        print(f"---------STEP 3b: RETRIEVE SPECIFIC FILE for PATH-----",file_path)
-        print("="*80)
-        
         try:
-            repository = self.client.repo
-            
-            print(f"\n📝 Retrieving file: {repository}:{branch}:{file_path}")
-            
             # REQUIREMENT: Get specific file by path
             content = self.client.get_cached_file_content(
                 branch=branch,
                 file_path=file_path
             )
-            
-            if content is None:
-                print(f"❌ File not found in cache!")
-                return False
-            
-            print(f"✅ Retrieved file content!")
-            print(f"   File: {file_path}")
-            print(f"   Content length: {len(content)} characters")
-            print(f"\n   Content preview (first 300 chars):")
-            print("   " + "─"*76)
-            preview = content[:100].replace("\n", "\n   ")
-            print("   " + preview)
-            if len(content) > 100:
-            # preview = content.replace("\n", "\n   ")
-            # print("   " + preview)
-            # if len(content) > 10000:
-                 print("   ...")
-            print("   " + "─"*76)
-            
-            return True
+            ok, report = self._render_file_preview(branch, file_path, content)
+            sys.stdout.write(report)
+            return ok
             
         except Exception as e:
             print(f"❌ Error in Step 3b: {e}")
             return False
     
+    def test_step_3b_retrieve_specific_files(self, branch: str, file_paths: List[str]) -> List[bool]:
+        """
+        Step 3b (batched): Retrieve several files by repository:branch:path
+        
+        Uses get_cached_file_contents(branch, paths) so the branch entry is
+        looked up once for all files; the reports are written in one call
+        """
+        try:
+            contents = self.client.get_cached_file_contents(
+                branch=branch,
+                file_paths=file_paths
+            )
+        except Exception as e:
+            print(f"❌ Error in Step 3b: {e}")
+            return [False] * len(file_paths)
+        
+        rendered = [
+            self._render_file_preview(branch, file_path, contents.get(file_path))
+            for file_path in file_paths
+        ]
+        sys.stdout.write("".join(report for _, report in rendered))
+        return [ok for ok, _ in rendered]
+    
+    def _render_file_preview(self, branch: str, file_path: str, content: Optional[str]) -> Tuple[bool, str]:
+        """Build the Step 3b report for one retrieved file"""
+        lines = [
+            "",
+            _SEP80,
+            f"---------STEP 3b: RETRIEVE SPECIFIC FILE for PATH----- {file_path}",
+            _SEP80,
+            "",
+            f"📝 Retrieving file: {self.client.repo}:{branch}:{file_path}",
+        ]
+        
+        if content is None:
+            lines.append(f"❌ File not found in cache!")
+            return False, "\n".join(lines) + "\n"
+        
+        lines.append(f"✅ Retrieved file content!")
+        lines.append(f"   File: {file_path}")
+        lines.append(f"   Content length: {len(content)} characters")
+        lines.append(f"\n   Content preview (first 300 chars):")
+        lines.append("   " + _HR76)
+        preview = content[:100].replace("\n", "\n   ")
+        lines.append("   " + preview)
+        if len(content) > 100:
+            lines.append("   ...")
+        lines.append("   " + _HR76)
+        
+        return True, "\n".join(lines) + "\n"
+    
     # ========================================================================
     # VERIFY PERFORMANCE (Cache should be instant)
     # ========================================================================
     
     def test_performance_cache_speed(self, branch: str) -> bool:
         """Verify cache is faster than first call"""
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("PERFORMANCE TEST: CACHE SPEED")
-        print("="*80)
+        print(_SEP80)
         
         try:
             import time
@@ -233,25 +268,24 @@ class CacheFlowTester:
             
             # Cold call
             print(f"\n📝 Cold call (from GitHub)...")
-            start = time.time()
+            start = time.perf_counter_ns()
             response1 = self.client.analyze_codebase(branch=branch)
-            time1 = time.time() - start
+            time1 = (time.perf_counter_ns() - start) / 1e9
             print(f"✅ Time: {time1:.3f}s ({len(response1.files_changed)} files)")
             
             # Warm call (from cache)
             print(f"\n📝 Warm call (from cache)...")
-            start = time.time()
+            start = time.perf_counter_ns()
             response2 = self.client.analyze_codebase(branch=branch)
-            time2 = time.time() - start
-            print(f"✅ Time: {time2:.3f}s ({len(response2.files_changed)} files)")
+            time2 = (time.perf_counter_ns() - start) / 1e9
+            print(f"✅ Time: {time2:.6f}s ({len(response2.files_changed)} files)")
             
-            # Calculate speedup
-            if time2 > 0:
-                speedup = time1 / time2
-                print(f"\n⚡ Performance improvement:")
-                print(f"   First call: {time1:.3f}s")
-                print(f"   Cached call: {time2:.3f}s")
-                print(f"   Speedup: {speedup:.1f}x faster!")
+            # Calculate speedup (monotonic ns clock, so time2 is never zero)
+            speedup = time1 / time2
+            print(f"\n⚡ Performance improvement:")
+            print(f"   First call: {time1:.3f}s")
+            print(f"   Cached call: {time2:.6f}s")
+            print(f"   Speedup: {speedup:.1f}x faster!")
             
             return True
             
@@ -281,26 +315,19 @@ class CacheFlowTester:
         
         # Step 3b: Retrieve specific (if file_path provided)
         if file_path:
-            results['retrieve_specific1'] = self.test_step_3b_retrieve_specific_file(
-                branch, file_path
-            )
-            path2 = "main.py"
-            results['retrieve_specific2'] = self.test_step_3b_retrieve_specific_file(
-                branch, path2
-            )
-            path3 = "src/routers/attach_test_plan_api.py"
-            results['retrieve_specific3'] = self.test_step_3b_retrieve_specific_file(
-                branch, path3
-            )
+            paths = [file_path, "main.py", "src/routers/attach_test_plan_api.py"]
+            retrieved = self.test_step_3b_retrieve_specific_files(branch, paths)
+            for i, ok in enumerate(retrieved, 1):
+                results[f'retrieve_specific{i}'] = ok
         # Performance test
         results['performance'] = self.test_performance_cache_speed(branch)
         
         # Summary
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("TEST SUMMARY")
-        print("="*80)
+        print(_SEP80)
         
-        passed = sum(1 for v in results.values() if v)
+        passed = sum(results.values())  # every result is a bool
         total = len(results)
         
         for test_name, result in results.items():
@@ -308,7 +335,7 @@ class CacheFlowTester:
             print(f"{status}: {test_name}")
         
         print(f"\nTotal: {passed}/{total} tests passed")
-        print("="*80)
+        print(_SEP80)
         
         return passed == total
 
@@ -319,9 +346,9 @@ class CacheFlowTester:
 
 if __name__ == "__main__":
     print("\n")
-    print("╔" + "="*78 + "╗")
+    print(_BOX_TOP)
     print("║" + "  Cache Flow Tester - Verify 3 Step Flow".center(78) + "║")
-    print("╚" + "="*78 + "╝")
+    print(_BOX_BOTTOM)
     
     try:
         # Initialize tester
@@ -27,6 +27,9 @@ class QEOrchestratorException(Exception):
     Includes support for error context and categorization.
     """
 
+    # Fixed attribute layout; no per-instance __dict__ is allocated
+    __slots__ = ('message', 'error_code', 'context', 'original_exception', '_str')
+
     def __init__(
         self,
         message: str,
@@ -48,8 +51,10 @@ class QEOrchestratorException(Exception):
         self.error_code = error_code
         self.context = context or {}
         self.original_exception = original_exception
+        # Fields are not changed after construction, so format once
+        self._str = self._build_str()
 
-    def __str__(self):
+    def _build_str(self) -> str:
         """Format exception as string with context"""
         base = self.message
         if self.error_code:
@@ -59,6 +64,14 @@ class QEOrchestratorException(Exception):
             base = f"{base} (Context: {context_str})"
         return base
 
+    def __str__(self):
+        """Return the formatted exception string built at construction"""
+        return self._str
+
+    def __reduce__(self):
+        """Pickle from constructor arguments (slots are not in BaseException's state)"""
+        return (self.__class__, (self.message, self.error_code, self.context, self.original_exception))
+
 
 # ==============================================
 # Client Exceptions
@@ -66,67 +79,67 @@ class QEOrchestratorException(Exception):
 
 class ClientException(QEOrchestratorException):
     """Base exception for client errors (Jira, GitHub, etc.)"""
-    pass
+    __slots__ = ()
 
 
 class JiraClientException(ClientException):
     """Jira client errors"""
-    pass
+    __slots__ = ()
 
 
 class JiraAuthenticationException(JiraClientException):
     """Jira authentication failed"""
-    pass
+    __slots__ = ()
 
 
 class JiraTicketNotFoundException(JiraClientException):
     """Jira ticket not found"""
-    pass
+    __slots__ = ()
 
 
 class JiraPermissionException(JiraClientException):
     """Insufficient Jira permissions"""
-    pass
+    __slots__ = ()
 
 
 class GitHubClientException(ClientException):
     """GitHub client errors"""
-    pass
+    __slots__ = ()
 
 
 class GitHubAuthenticationException(GitHubClientException):
     """GitHub authentication failed"""
-    pass
+    __slots__ = ()
 
 
 class GitHubRepositoryNotFoundException(GitHubClientException):
     """GitHub repository not found"""
-    pass
+    __slots__ = ()
 
 
 class GitHubRateLimitException(GitHubClientException):
     """GitHub rate limit exceeded"""
-    pass
+    __slots__ = ()
 
 
 class GeminiClientException(ClientException):
     """Gemini AI client errors"""
-    pass
+    __slots__ = ()
 
 
 class GeminiAuthenticationException(GeminiClientException):
     """Gemini authentication failed"""
-    pass
+    __slots__ = ()
 
 
 class GeminiQuotaException(GeminiClientException):
     """Gemini quota exceeded"""
-    pass
+    __slots__ = ()
 
 
 class GeminiGenerationException(GeminiClientException):
     """Gemini failed to generate response"""
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -135,17 +148,17 @@ class GeminiGenerationException(GeminiClientException):
 
 class ConfigurationException(QEOrchestratorException):
     """Configuration errors"""
-    pass
+    __slots__ = ()
 
 
 class MissingConfigException(ConfigurationException):
     """Required configuration is missing"""
-    pass
+    __slots__ = ()
 
 
 class InvalidConfigException(ConfigurationException):
     """Configuration value is invalid"""
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -154,62 +167,62 @@ class InvalidConfigException(ConfigurationException):
 
 class AgentException(QEOrchestratorException):
     """Base exception for agent errors"""
-    pass
+    __slots__ = ()
 
 
 class TestGenerationException(AgentException):
     """Test generation agent errors"""
-    pass
+    __slots__ = ()
 
 
 class LocatorExtractionException(TestGenerationException):
     """Failed to extract locators from codebase"""
-    pass
+    __slots__ = ()
 
 
 class CodeGenerationException(TestGenerationException):
     """Failed to generate test code"""
-    pass
+    __slots__ = ()
 
 
 class TestExecutionException(AgentException):
     """Test execution agent errors"""
-    pass
+    __slots__ = ()
 
 
 class TestRunnerException(TestExecutionException):
     """Failed to run tests"""
-    pass
+    __slots__ = ()
 
 
 class ResultParsingException(TestExecutionException):
     """Failed to parse test results"""
-    pass
+    __slots__ = ()
 
 
 class ArtifactCollectionException(TestExecutionException):
     """Failed to collect test artifacts"""
-    pass
+    __slots__ = ()
 
 
 class DefectDetectionException(AgentException):
     """Defect detection agent errors"""
-    pass
+    __slots__ = ()
 
 
 class FailureAnalysisException(DefectDetectionException):
     """Failed to analyze test failures"""
-    pass
+    __slots__ = ()
 
 
 class SelfHealingException(DefectDetectionException):
     """Failed to self-heal tests"""
-    pass
+    __slots__ = ()
 
 
 class BugReportingException(DefectDetectionException):
     """Failed to create bug reports"""
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -218,22 +231,22 @@ class BugReportingException(DefectDetectionException):
 
 class WorkflowException(QEOrchestratorException):
     """Workflow execution errors"""
-    pass
+    __slots__ = ()
 
 
 class WorkflowStateException(WorkflowException):
     """Invalid workflow state"""
-    pass
+    __slots__ = ()
 
 
 class WorkflowTimeoutException(WorkflowException):
     """Workflow execution timed out"""
-    pass
+    __slots__ = ()
 
 
 class WorkflowValidationException(WorkflowException):
     """Workflow validation failed"""
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -242,22 +255,22 @@ class WorkflowValidationException(WorkflowException):
 
 class DataException(QEOrchestratorException):
     """Data processing errors"""
-    pass
+    __slots__ = ()
 
 
 class ValidationException(DataException):
     """Data validation failed"""
-    pass
+    __slots__ = ()
 
 
 class ParsingException(DataException):
     """Failed to parse data"""
-    pass
+    __slots__ = ()
 
 
 class CacheException(DataException):
     """Cache operation failed"""
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -271,7 +284,7 @@ class RecoverableException(QEOrchestratorException):
     These errors can potentially be retried or handled gracefully.
     Examples: network timeouts, rate limits, temporary service unavailability
     """
-    pass
+    __slots__ = ()
 
 
 class NonRecoverableException(QEOrchestratorException):
@@ -281,7 +294,7 @@ class NonRecoverableException(QEOrchestratorException):
     These errors require manual intervention and cannot be automatically fixed.
     Examples: authentication failures, missing configuration, permission errors
     """
-    pass
+    __slots__ = ()
 
 
 # ==============================================
@@ -327,13 +340,15 @@ def format_exception_for_jira(exception: Exception) -> str:
         Formatted Jira markdown string
     """
     if isinstance(exception, QEOrchestratorException):
-        message = f"*Error:* {exception.message}"
+        lines = []
         if exception.error_code:
-            message = f"*Error Code:* {{monospace}}{exception.error_code}{{monospace}}\n{message}"
-        if exception.context:
-            message += f"\n*Context:*\n"
-            for key, value in exception.context.items():
-                message += f"- {key}: {value}\n"
-        return message
+            lines.append(f"*Error Code:* {{monospace}}{exception.error_code}{{monospace}}")
+        lines.append(f"*Error:* {exception.message}")
+        if not exception.context:
+            return "\n".join(lines)
+        lines.append("*Context:*")
+        lines.extend(f"- {key}: {value}" for key, value in exception.context.items())
+        # Context block keeps its trailing newline
+        return "\n".join(lines) + "\n"
     else:
         return f"*Error:* {str(exception)}"
\ No newline at end of file
@@ -5,6 +5,11 @@
 from typing import Optional, Dict, Any
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def safe_get(dictionary: Dict, *keys, default=None) -> Any:
     """
     Safely get nested dictionary values
@@ -14,11 +19,12 @@ def safe_get(dictionary: Dict, *keys, default=None) -> Any:
     """
     result = dictionary
     for key in keys:
-        if isinstance(result, dict):
-            result = result.get(key)
-            if result is None:
-                return default
-        else:
+        # Anything with a .get (dict or other mapping) can be descended into
+        getter = getattr(result, 'get', None)
+        if getter is None:
+            return default
+        result = getter(key)
+        if result is None:
             return default
     return result if result is not None else default
 
@@ -30,7 +36,19 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> st
 
 def format_json(data: Any, indent: int = 2) -> str:
     """Format data as pretty JSON string"""
+    # orjson only supports 2-space indentation. Datetimes are passed through to
+    # default=str so they keep the json.dumps format ("2024-01-01 00:00:00")
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode()
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the stdlib encoder handles
+            pass
     try:
         return json.dumps(data, indent=indent, default=str)
-    except:
+    except (TypeError, ValueError):
         return str(data)
\ No newline at end of file
@@ -3,15 +3,45 @@
 # ==============================================
 
 import logging
+import logging.handlers
 import sys
+import queue
+import atexit
+import threading
 import json
 import os
-from typing import Optional, Dict, Any
+import time
+import functools
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
-import threading
+from enum import IntEnum
+from types import MappingProxyType
+from collections import ChainMap
+from contextvars import ContextVar, Token
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Contextual fields copied from LogRecord extras into the structured output
+_EXTRA_FIELDS = ('agent', 'ticket_key', 'execution_id', 'error_code', 'context')
+
+# Correlation ID for the current thread / asyncio task
+_correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+
+# Ambient log fields for the current thread / asyncio task (never mutated in place)
+_log_ctx: ContextVar[Dict[str, Any]] = ContextVar('log_context', default={})
+
 
-# Thread-local storage for correlation IDs
-_thread_local = threading.local()
+if orjson is not None:
+    def _dumps(data: Dict[str, Any]) -> str:
+        """Serialize a log record dict with orjson"""
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def _dumps(data: Dict[str, Any]) -> str:
+        """Serialize a log record dict with the stdlib encoder"""
+        return json.dumps(data, default=str)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -30,13 +60,26 @@ class StructuredFormatter(logging.Formatter):
         """
         super().__init__()
         self.json_format = json_format
-
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with contextual fields"""
+        # (epoch second, ISO prefix) of the last formatted record
+        self._ts_cache = (None, '')
+        # Bind the output format once instead of branching on every record
+        self.format = self._format_json if json_format else self._format_text
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp, reusing the seconds prefix within the same second"""
+        sec = int(created)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{int((created - sec) * 1e6):06d}Z"
+
+    def _build_log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Collect the base and contextual fields of a log record"""
 
         # Base log data
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -45,60 +88,98 @@ class StructuredFormatter(logging.Formatter):
             'line': record.lineno
         }
 
-        # Add correlation ID if available
-        correlation_id = get_correlation_id()
+        # Add correlation ID if available (captured on the record when queued)
+        record_dict = record.__dict__
+        correlation_id = record_dict.get('correlation_id') or get_correlation_id()
         if correlation_id:
             log_data['correlation_id'] = correlation_id
 
-        # Add contextual fields from extra
-        if hasattr(record, 'agent'):
-            log_data['agent'] = record.agent
-        if hasattr(record, 'ticket_key'):
-            log_data['ticket_key'] = record.ticket_key
-        if hasattr(record, 'execution_id'):
-            log_data['execution_id'] = record.execution_id
-        if hasattr(record, 'error_code'):
-            log_data['error_code'] = record.error_code
-        if hasattr(record, 'context'):
-            log_data['context'] = record.context
+        # Add contextual fields from extra (extras live in the record's __dict__)
+        for field_name in _EXTRA_FIELDS:
+            if field_name in record_dict:
+                log_data[field_name] = record_dict[field_name]
 
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
 
-        if self.json_format:
-            # JSON format for production/parsing
-            return json.dumps(log_data)
-        else:
-            # Human-readable format for development
-            parts = [
-                log_data['timestamp'],
-                f"{log_data['level']:<8}",
-                f"{log_data['logger']:<30}"
-            ]
+        return log_data
+
+    def _format_json(self, record: logging.LogRecord) -> str:
+        """JSON format for production/parsing"""
+        return _dumps(self._build_log_data(record))
+
+    def _format_text(self, record: logging.LogRecord) -> str:
+        """Human-readable format for development"""
+        log_data = self._build_log_data(record)
 
-            # Add contextual fields
-            context_parts = []
-            if 'correlation_id' in log_data:
-                context_parts.append(f"[{log_data['correlation_id'][:8]}]")
-            if 'agent' in log_data:
-                context_parts.append(f"[{log_data['agent']}]")
-            if 'ticket_key' in log_data:
-                context_parts.append(f"[{log_data['ticket_key']}]")
-            if 'error_code' in log_data:
-                context_parts.append(f"[{log_data['error_code']}]")
+        parts = [
+            log_data['timestamp'],
+            f"{log_data['level']:<8}",
+            f"{log_data['logger']:<30}"
+        ]
 
-            if context_parts:
-                parts.append(' '.join(context_parts))
+        # Add contextual fields
+        context_parts = []
+        if 'correlation_id' in log_data:
+            context_parts.append(f"[{log_data['correlation_id'][:8]}]")
+        if 'agent' in log_data:
+            context_parts.append(f"[{log_data['agent']}]")
+        if 'ticket_key' in log_data:
+            context_parts.append(f"[{log_data['ticket_key']}]")
+        if 'error_code' in log_data:
+            context_parts.append(f"[{log_data['error_code']}]")
 
-            # Add message
-            parts.append(f"| {log_data['message']}")
+        if context_parts:
+            parts.append(' '.join(context_parts))
 
-            # Add exception if present
-            if 'exception' in log_data:
-                parts.append(f"\n{log_data['exception']}")
+        # Add message
+        parts.append(f"| {log_data['message']}")
 
-            return ' '.join(parts)
+        # Add exception if present
+        if 'exception' in log_data:
+            parts.append(f"\n{log_data['exception']}")
+
+        return ' '.join(parts)
+
+
+# Extras set by the log helpers in this module (timers, trackers, cache, error codes)
+_LOG_EXTRA_KEYS = frozenset({
+    'agent', 'ticket_key', 'execution_id', 'correlation_id', 'context',
+    'operation', 'duration_ms', 'duration_us', 'success', 'error',
+    'stage', 'progress', 'status', 'step', 'steps',
+    'cache_key', 'cache_hit', 'time_saved_seconds', 'cache_stats',
+    'error_code', 'error_name', 'error_description', 'error_type',
+})
+
+
+class OrjsonFormatter(logging.Formatter):
+    """
+    Compact JSON formatter that keeps every helper extra field
+
+    Emits {"ts", "level", "logger", "msg", <extras>} with the raw epoch
+    timestamp, serialized with orjson (stdlib json if orjson is unavailable).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a single JSON line"""
+        payload = {
+            'ts': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        payload.update({k: v for k, v in record.__dict__.items() if k in _LOG_EXTRA_KEYS})
+
+        if 'correlation_id' not in payload:
+            correlation_id = get_correlation_id()
+            if correlation_id:
+                payload['correlation_id'] = correlation_id
+
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+
+        return _dumps(payload)
 
 
 class StructuredLogger(logging.LoggerAdapter):
@@ -135,28 +216,27 @@ class StructuredLogger(logging.LoggerAdapter):
 
 def set_correlation_id(correlation_id: str):
     """
-    Set correlation ID for current thread
+    Set correlation ID for current thread or asyncio task
 
     Args:
         correlation_id: Unique identifier for request/workflow
     """
-    _thread_local.correlation_id = correlation_id
+    _correlation_id.set(correlation_id)
 
 
 def get_correlation_id() -> Optional[str]:
     """
-    Get correlation ID for current thread
+    Get correlation ID for current thread or asyncio task
 
     Returns:
         Correlation ID or None
     """
-    return getattr(_thread_local, 'correlation_id', None)
+    return _correlation_id.get()
 
 
 def clear_correlation_id():
-    """Clear correlation ID for current thread"""
-    if hasattr(_thread_local, 'correlation_id'):
-        delattr(_thread_local, 'correlation_id')
+    """Clear correlation ID for current thread or asyncio task"""
+    _correlation_id.set(None)
 
 
 def generate_correlation_id(prefix: str = '') -> str:
@@ -177,10 +257,137 @@ def generate_correlation_id(prefix: str = '') -> str:
     return f"{timestamp}-{unique_id}"
 
 
+# ==============================================
+# Ambient Log Context
+# ==============================================
+
+def push_log_context(**fields) -> Token:
+    """
+    Add fields to every record logged in the current thread or asyncio task
+
+    Args:
+        **fields: Context fields (agent, ticket_key, execution_id, etc.)
+
+    Returns:
+        Token to pass to pop_log_context
+    """
+    return _log_ctx.set({**_log_ctx.get(), **fields})
+
+
+def pop_log_context(token: Token):
+    """Restore the log context that was active before push_log_context"""
+    _log_ctx.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Copy the ambient log context onto records a handler is about to emit
+
+    Fields passed explicitly via extra take precedence.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record_dict = record.__dict__
+        for key, value in _log_ctx.get().items():
+            if key not in record_dict:
+                record_dict[key] = value
+        return True
+
+
+_CONTEXT_FILTER = ContextFilter()
+
+
 # ==============================================
 # Logger Factory
 # ==============================================
 
+# Formatters are stateless apart from the timestamp cache, so all handlers share them
+_TEXT_FMT = StructuredFormatter(json_format=False)
+_JSON_FMT = StructuredFormatter(json_format=True)
+_ORJSON_FMT = OrjsonFormatter()
+
+
+def _formatter_for(json_format: bool) -> logging.Formatter:
+    """Shared formatter for a format flag (LOG_FORMAT=orjson selects the compact one)"""
+    if not json_format:
+        return _TEXT_FMT
+    if os.environ.get('LOG_FORMAT', 'text').lower() == 'orjson':
+        return _ORJSON_FMT
+    return _JSON_FMT
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (callers may mutate them after the call returns) and
+        # capture the caller's correlation ID, which the listener thread cannot see
+        record.msg = record.getMessage()
+        record.args = None
+        if 'correlation_id' not in record.__dict__:
+            record.correlation_id = get_correlation_id()
+        return record
+
+
+# One queue handler/listener pair per output format
+_async_handlers: Dict[bool, logging.handlers.QueueHandler] = {}
+_async_lock = threading.Lock()
+
+
+def setup_async_logging(json_format: bool = False) -> logging.handlers.QueueHandler:
+    """
+    Get the shared queue handler that offloads log output to a background thread
+
+    Loggers using the returned handler only enqueue records; a QueueListener
+    writes them to stdout with the structured formatter. The listener is
+    stopped (and the queue drained) at interpreter exit.
+
+    Args:
+        json_format: Output format of the listener's stdout handler
+
+    Returns:
+        QueueHandler to attach to a logger
+    """
+    with _async_lock:
+        handler = _async_handlers.get(json_format)
+        if handler is None:
+            log_queue = queue.SimpleQueue()
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(_formatter_for(json_format))
+
+            listener = logging.handlers.QueueListener(
+                log_queue, stream_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+
+            handler = _DeferredQueueHandler(log_queue)
+            _async_handlers[json_format] = handler
+        return handler
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_logger(name: str, level: Optional[int], json_format: bool) -> logging.Logger:
+    """Attach the structured handler to a logger once per (name, level, format)"""
+    logger = logging.getLogger(name)
+
+    if not logger.handlers:
+        if os.environ.get('LOG_ASYNC', 'false').lower() == 'true':
+            # Enqueue only; output happens on the listener thread
+            handler = setup_async_logging(json_format)
+        else:
+            # Console handler
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(_formatter_for(json_format))
+        # Runs in the calling thread, so it sees the caller's context (even when queued)
+        handler.addFilter(_CONTEXT_FILTER)
+        logger.addHandler(handler)
+        logger.setLevel(level or logging.INFO)
+        logger.propagate = False
+
+    return logger
+
+
 def get_logger(
     name: str,
     level: Optional[int] = None,
@@ -193,7 +400,7 @@ def get_logger(
     Args:
         name: Logger name (usually __name__)
         level: Logging level (default: INFO)
-        json_format: Use JSON format (default: from env LOG_FORMAT=json)
+        json_format: Use JSON format (default: from env LOG_FORMAT=json|orjson)
         **context: Default context fields (agent, ticket_key, etc.)
 
     Returns:
@@ -212,23 +419,11 @@ def get_logger(
         logger = get_logger(__name__, json_format=True)
         logger.info("JSON output")
     """
-    logger = logging.getLogger(name)
+    # Determine format from environment or parameter
+    if json_format is None:
+        json_format = os.environ.get('LOG_FORMAT', 'text').lower() in ('json', 'orjson')
 
-    if not logger.handlers:
-        # Console handler
-        handler = logging.StreamHandler(sys.stdout)
-
-        # Determine format from environment or parameter
-        if json_format is None:
-            json_format = os.environ.get('LOG_FORMAT', 'text').lower() == 'json'
-
-        # Use structured formatter
-        formatter = StructuredFormatter(json_format=json_format)
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(level or logging.INFO)
-        logger.propagate = False
+    logger = _configure_logger(name, level, json_format)
 
     # Return structured logger if context provided
     if context:
@@ -266,17 +461,15 @@ def log_with_context(
             execution_id='exec-001'
         )
     """
-    logger.log(level, message, extra=context)
+    if logger.isEnabledFor(level):
+        # stacklevel=2 attributes the record to our caller rather than this wrapper
+        logger.log(level, message, extra=context, stacklevel=2)
 
 
 # ==============================================
 # Performance Tracking
 # ==============================================
 
-import time
-import functools
-
-
 class PerformanceTimer:
     """
     Context manager for timing operations and logging duration
@@ -284,8 +477,17 @@ class PerformanceTimer:
     Usage:
         with PerformanceTimer(logger, "operation_name", ticket_key="PROJ-123"):
             # ... operation code
+
+    The context fields are passed on the timer's own records, and are also
+    pushed as ambient log context for the duration of the block, so records
+    logged inside it carry them too.
     """
 
+    __slots__ = (
+        'logger', 'operation', 'log_level', 'context',
+        'start_time', 'duration_ms', 'duration_us', '_ctx_token'
+    )
+
     def __init__(
         self,
         logger: logging.Logger,
@@ -308,28 +510,36 @@ class PerformanceTimer:
         self.context = context
         self.start_time = None
         self.duration_ms = None
+        self.duration_us = None
+        self._ctx_token = None
 
     def __enter__(self):
         """Start timing"""
-        self.start_time = time.time()
-        self.logger.debug(
-            f"Starting {self.operation}",
-            extra={'operation': self.operation, **self.context}
-        )
+        if self.context:
+            self._ctx_token = push_log_context(**self.context)
+        self.start_time = time.perf_counter()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Starting %s", self.operation,
+                extra={'operation': self.operation, **self.context}
+            )
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and log duration"""
-        self.duration_ms = int((time.time() - self.start_time) * 1000)
+        # perf_counter is monotonic; keep microseconds for sub-ms operations
+        self.duration_us = int((time.perf_counter() - self.start_time) * 1_000_000)
+        self.duration_ms = self.duration_us // 1000
 
         if exc_type is None:
             # Success
             self.logger.log(
                 self.log_level,
-                f"✓ {self.operation} completed in {self.duration_ms}ms",
+                "✓ %s completed in %dms", self.operation, self.duration_ms,
                 extra={
                     'operation': self.operation,
                     'duration_ms': self.duration_ms,
+                    'duration_us': self.duration_us,
                     'success': True,
                     **self.context
                 }
@@ -337,21 +547,30 @@ class PerformanceTimer:
         else:
             # Error occurred
             self.logger.error(
-                f"✗ {self.operation} failed after {self.duration_ms}ms: {exc_val}",
+                "✗ %s failed after %dms: %s", self.operation, self.duration_ms, exc_val,
                 extra={
                     'operation': self.operation,
                     'duration_ms': self.duration_ms,
+                    'duration_us': self.duration_us,
                     'success': False,
                     'error': str(exc_val),
                     **self.context
                 }
             )
+
+        if self._ctx_token is not None:
+            pop_log_context(self._ctx_token)
+            self._ctx_token = None
         return False  # Don't suppress exception
 
     def get_duration(self) -> Optional[int]:
         """Get duration in milliseconds"""
         return self.duration_ms
 
+    def get_duration_us(self) -> Optional[int]:
+        """Get duration in microseconds"""
+        return self.duration_us
+
 
 def log_performance(operation: str, log_level: int = logging.INFO, **context):
     """
@@ -399,13 +618,24 @@ class StageProgressTracker:
         tracker.step("Generating code", progress=40)
         # ...
         tracker.complete()
+
+    For tight per-item loops, pass batch_size > 1 to emit one record per
+    batch (or per flush interval) instead of one per step.
     """
 
+    __slots__ = (
+        'logger', 'stage', 'total_steps', 'batch_size', 'flush_interval_ms',
+        'context', 'current_step', 'start_time', '_pending', '_last_flush',
+        '_base_extra'
+    )
+
     def __init__(
         self,
         logger: logging.Logger,
         stage: str,
         total_steps: int = 100,
+        batch_size: int = 1,
+        flush_interval_ms: int = 250,
         **context
     ):
         """
@@ -415,21 +645,31 @@ class StageProgressTracker:
             logger: Logger instance
             stage: Stage name
             total_steps: Total number of steps (for progress calculation)
+            batch_size: Steps per emitted record (1 logs every step)
+            flush_interval_ms: Emit pending steps at least this often when batching
             **context: Additional context fields
         """
         self.logger = logger
         self.stage = stage
         self.total_steps = total_steps
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
         self.context = context
         self.current_step = 0
         self.start_time = None
+        self._pending = []
+        self._last_flush = time.perf_counter()
+        # Fields shared by every step record; layered under per-step fields
+        self._base_extra = {'stage': stage, **context}
 
     def start(self, message: str = None):
         """Start tracking stage"""
-        self.start_time = time.time()
-        msg = message or f"Starting {self.stage}"
+        self.start_time = time.perf_counter()
+        self._last_flush = self.start_time
+        msg, args = (message, ()) if message else ("Starting %s", (self.stage,))
         self.logger.info(
             msg,
+            *args,
             extra={
                 'stage': self.stage,
                 'progress': 0,
@@ -448,27 +688,60 @@ class StageProgressTracker:
         """
         self.current_step += 1
 
+        # Skip progress math and extra dict when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         if progress is None:
             progress = int((self.current_step / self.total_steps) * 100)
+        progress = min(progress, 99)  # Never show 100% until complete
+
+        if self.batch_size <= 1:
+            self.logger.info(
+                message,
+                extra=ChainMap(
+                    {'progress': progress, 'status': 'processing', 'step': self.current_step},
+                    self._base_extra
+                )
+            )
+            return
+
+        self._pending.append((message, progress))
+        if (len(self._pending) >= self.batch_size or
+                (time.perf_counter() - self._last_flush) * 1000 >= self.flush_interval_ms):
+            self._flush()
+
+    def _flush(self):
+        """Emit pending batched steps as one record"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        self._last_flush = time.perf_counter()
+        message, progress = pending[-1]
 
         self.logger.info(
-            message,
-            extra={
-                'stage': self.stage,
-                'progress': min(progress, 99),  # Never show 100% until complete
-                'status': 'processing',
-                'step': self.current_step,
-                **self.context
-            }
+            "%s (%d steps)", message, len(pending),
+            extra=ChainMap(
+                {
+                    'progress': progress,
+                    'status': 'processing',
+                    'step': self.current_step,
+                    'steps': [m for m, _ in pending]
+                },
+                self._base_extra
+            )
         )
 
     def complete(self, message: str = None):
         """Complete stage tracking"""
-        duration_ms = int((time.time() - self.start_time) * 1000) if self.start_time else 0
-        msg = message or f"✓ {self.stage} completed"
+        self._flush()
+        duration_ms = int((time.perf_counter() - self.start_time) * 1000) if self.start_time is not None else 0
+        msg, args = (message, ()) if message else ("✓ %s completed", (self.stage,))
 
         self.logger.info(
             msg,
+            *args,
             extra={
                 'stage': self.stage,
                 'progress': 100,
@@ -480,11 +753,10 @@ class StageProgressTracker:
 
     def error(self, message: str, error: Exception = None):
         """Mark stage as failed"""
-        duration_ms = int((time.time() - self.start_time) * 1000) if self.start_time else 0
-        error_msg = f"✗ {message}"
-
+        self._flush()
+        duration_ms = int((time.perf_counter() - self.start_time) * 1000) if self.start_time is not None else 0
         self.logger.error(
-            error_msg,
+            "✗ %s", message,
             exc_info=error is not None,
             extra={
                 'stage': self.stage,
@@ -507,6 +779,7 @@ def log_cache_operation(
     cache_key: str,
     hit: bool,
     time_saved_seconds: Optional[int] = None,
+    cache_stats: Optional[Dict[str, Any]] = None,
     **context
 ):
     """
@@ -518,6 +791,7 @@ def log_cache_operation(
         cache_key: Cache key used
         hit: Whether cache was hit
         time_saved_seconds: Estimated time saved by cache hit
+        cache_stats: Aggregate cache statistics (e.g., CacheManager.stats())
         **context: Additional context fields
 
     Example:
@@ -529,20 +803,26 @@ def log_cache_operation(
             time_saved_seconds=60
         )
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     if hit:
-        msg = f"✓ Cache hit for {operation}"
         if time_saved_seconds:
-            msg += f" - saved ~{time_saved_seconds}s"
+            msg, args = "✓ Cache hit for %s - saved ~%ss", (operation, time_saved_seconds)
+        else:
+            msg, args = "✓ Cache hit for %s", (operation,)
     else:
-        msg = f"Cache miss for {operation} - fetching fresh data"
+        msg, args = "Cache miss for %s - fetching fresh data", (operation,)
 
     logger.info(
         msg,
+        *args,
         extra={
             'operation': operation,
             'cache_key': cache_key,
             'cache_hit': hit,
             'time_saved_seconds': time_saved_seconds,
+            'cache_stats': cache_stats,
             **context
         }
     )
@@ -552,6 +832,78 @@ def log_cache_operation(
 # Error Code Management
 # ==============================================
 
+class ErrorCode(IntEnum):
+    """
+    Numeric error codes
+
+    Member names match the ErrorCodeRegistry string constants; descriptions
+    are looked up by value in _DESCRIPTIONS.
+    """
+
+    # Jira errors
+    ERR_JIRA_FETCH = 1
+    ERR_JIRA_NOT_FOUND = 2
+    ERR_JIRA_COMMENT = 3
+    ERR_JIRA_ATTACH = 4
+    ERR_JIRA_FORMAT = 5
+
+    # GitHub errors
+    ERR_GITHUB_BRANCH = 6
+    ERR_GITHUB_COMMIT = 7
+    ERR_GITHUB_PR = 8
+    ERR_GITHUB_NOT_FOUND = 9
+    ERR_GITHUB_AUTH = 10
+
+    # Generation errors
+    ERR_GEN_FAILED = 11
+    ERR_GEN_PLAN = 12
+    ERR_GEN_CODE = 13
+    ERR_GEN_LOCATOR = 14
+    ERR_GEN_COVERAGE = 15
+
+    # Execution errors
+    ERR_EXEC_FAILED = 16
+    ERR_EXEC_ENV = 17
+    ERR_EXEC_TIMEOUT = 18
+    ERR_EXEC_PLAYWRIGHT = 19
+    ERR_EXEC_SETUP = 20
+
+    # Configuration errors
+    ERR_CONFIG_MISSING = 21
+    ERR_CONFIG_INVALID = 22
+    ERR_CONFIG_CLIENT = 23
+    ERR_CONFIG_ENV = 24
+
+
+# Indexed by ErrorCode.value - 1
+_DESCRIPTIONS = (
+    "Failed to fetch Jira ticket",
+    "Jira ticket not found",
+    "Failed to add Jira comment",
+    "Failed to attach file to Jira",
+    "Invalid Jira ticket format",
+    "Failed to create GitHub branch",
+    "Failed to commit to GitHub",
+    "Failed to create GitHub PR",
+    "GitHub repository not found",
+    "GitHub authentication failed",
+    "Test generation failed",
+    "Invalid test plan",
+    "Code generation failed",
+    "Locator extraction failed",
+    "Insufficient test coverage",
+    "Test execution failed",
+    "Test environment unavailable",
+    "Test execution timeout",
+    "Playwright error",
+    "Test setup failed",
+    "Missing required configuration",
+    "Invalid configuration value",
+    "Client initialization failed",
+    "Environment variable missing",
+)
+
+
 class ErrorCodeRegistry:
     """
     Registry for standardized error codes
@@ -562,6 +914,9 @@ class ErrorCodeRegistry:
     - ERR_GEN_* : Test generation errors
     - ERR_EXEC_* : Test execution errors
     - ERR_CONFIG_* : Configuration errors
+
+    The string constants are kept for existing callers; ErrorCode is the
+    numeric equivalent and is accepted wherever a code is.
     """
 
     # Jira errors
@@ -599,40 +954,27 @@ class ErrorCodeRegistry:
     ERR_CONFIG_ENV = "ERR_CONFIG_004"
 
     @classmethod
-    def get_description(cls, error_code: str) -> str:
+    def get_description(cls, error_code: Union[ErrorCode, str]) -> str:
         """Get human-readable description for error code"""
-        descriptions = {
-            cls.ERR_JIRA_FETCH: "Failed to fetch Jira ticket",
-            cls.ERR_JIRA_NOT_FOUND: "Jira ticket not found",
-            cls.ERR_JIRA_COMMENT: "Failed to add Jira comment",
-            cls.ERR_JIRA_ATTACH: "Failed to attach file to Jira",
-            cls.ERR_JIRA_FORMAT: "Invalid Jira ticket format",
-            cls.ERR_GITHUB_BRANCH: "Failed to create GitHub branch",
-            cls.ERR_GITHUB_COMMIT: "Failed to commit to GitHub",
-            cls.ERR_GITHUB_PR: "Failed to create GitHub PR",
-            cls.ERR_GITHUB_NOT_FOUND: "GitHub repository not found",
-            cls.ERR_GITHUB_AUTH: "GitHub authentication failed",
-            cls.ERR_GEN_FAILED: "Test generation failed",
-            cls.ERR_GEN_PLAN: "Invalid test plan",
-            cls.ERR_GEN_CODE: "Code generation failed",
-            cls.ERR_GEN_LOCATOR: "Locator extraction failed",
-            cls.ERR_GEN_COVERAGE: "Insufficient test coverage",
-            cls.ERR_EXEC_FAILED: "Test execution failed",
-            cls.ERR_EXEC_ENV: "Test environment unavailable",
-            cls.ERR_EXEC_TIMEOUT: "Test execution timeout",
-            cls.ERR_EXEC_PLAYWRIGHT: "Playwright error",
-            cls.ERR_EXEC_SETUP: "Test setup failed",
-            cls.ERR_CONFIG_MISSING: "Missing required configuration",
-            cls.ERR_CONFIG_INVALID: "Invalid configuration value",
-            cls.ERR_CONFIG_CLIENT: "Client initialization failed",
-            cls.ERR_CONFIG_ENV: "Environment variable missing",
-        }
-        return descriptions.get(error_code, "Unknown error")
+        if not isinstance(error_code, ErrorCode):
+            error_code = _CODES_BY_STRING.get(error_code)
+            if error_code is None:
+                return "Unknown error"
+        return _DESCRIPTIONS[error_code.value - 1]
+
+
+# Legacy string code -> ErrorCode, built once at import
+_CODES_BY_STRING = MappingProxyType({
+    getattr(ErrorCodeRegistry, code.name): code for code in ErrorCode
+})
+
+# Indexed by ErrorCode.value - 1: the stable string code logged for each member
+_STRINGS_BY_CODE = tuple(getattr(ErrorCodeRegistry, code.name) for code in ErrorCode)
 
 
 def log_error_with_code(
     logger: logging.Logger,
-    error_code: str,
+    error_code: Union[ErrorCode, str],
     message: str,
     exception: Optional[Exception] = None,
     **context
@@ -642,7 +984,7 @@ def log_error_with_code(
 
     Args:
         logger: Logger instance
-        error_code: Error code from ErrorCodeRegistry
+        error_code: ErrorCode member or string code from ErrorCodeRegistry
         message: Error message
         exception: Optional exception object
         **context: Additional context fields
@@ -657,13 +999,21 @@ def log_error_with_code(
         )
     """
     error_description = ErrorCodeRegistry.get_description(error_code)
-    full_message = f"[{error_code}] {message}"
+    # The stable string code is always logged, however the caller passed it, so
+    # log searches and alerts match; the member name is a separate field
+    if isinstance(error_code, ErrorCode):
+        code, name = _STRINGS_BY_CODE[error_code.value - 1], error_code.name
+    else:
+        code = error_code
+        member = _CODES_BY_STRING.get(error_code)
+        name = member.name if member is not None else None
 
     logger.error(
-        full_message,
+        "[%s] %s", code, message,
         exc_info=exception is not None,
         extra={
-            'error_code': error_code,
+            'error_code': code,
+            'error_name': name,
             'error_description': error_description,
             'error_type': type(exception).__name__ if exception else None,
             **context
@@ -1,4 +1,9 @@
 import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from src.utils.logger import get_logger
 from src.clients.github_client import GitHubClient
@@ -6,15 +11,89 @@ from src.models.jira_models import JiraTicket
 
 logger = get_logger(__name__)
 
+# Splits a path into name and extension, keeping compound ".spec.<ext>" together
+_SPEC_EXT_RE = re.compile(r'^(.*?)((?:\.spec)?\.[^.]+)$')
+# Characters replaced with "-" when turning a scenario id into a filename part
+_ID_SANITIZE_RE = re.compile(r'[ _]')
+# data-testid="..." and id="..." attributes, matched in a single pass per file
+_LOCATOR_RE = re.compile(
+    r'''data-testid=["']([^"']+)["']|\bid=["']([^"']+)["']'''
+)
+# Source files that can declare UI locators
+_UI_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.vue', '.html')
+
+
+@lru_cache(maxsize=1024)
+def _short_hash(title: str) -> str:
+    """Short stable hash used as a fallback scenario id"""
+    return hashlib.md5(title.encode()).hexdigest()[:6]
+
+
+@lru_cache(maxsize=1024)
+def _clean_scenario_id(scenario_id: str) -> str:
+    """Sanitize a scenario id for use in a filename (e.g., "TS_001" -> "ts-001")"""
+    return _ID_SANITIZE_RE.sub("-", scenario_id.lower())
+
+
+def _changed_file_path(file_item: Any) -> Optional[str]:
+    """Get the path of a files_changed entry (a path str, a dict or a file object)"""
+    if isinstance(file_item, str):
+        return file_item
+    if isinstance(file_item, dict):
+        return file_item.get('path')
+    return getattr(file_item, 'path', None)
+
+
 class CacheManager:
-    """Simple in-memory cache for test generation"""
-    _store = {}
+    """Simple in-memory LRU cache with per-entry TTL for test generation"""
+    __slots__ = ('_store', '_hits', '_misses', '_evictions', '_lock')
+    
+    MAX_SIZE = 10_000
+    
+    def __init__(self):
+        # key -> (expires_at, value), least recently used first
+        self._store = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Any:
-        return self._store.get(key)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._store[key]
+                self._misses += 1
+                return None
+            
+            self._store.move_to_end(key)
+            self._hits += 1
+            return value
     
     def set(self, key: str, value: Any, ttl: int = 3600):
-        self._store[key] = value
+        with self._lock:
+            self._store[key] = (time.monotonic() + ttl, value)
+            self._store.move_to_end(key)
+            if len(self._store) > self.MAX_SIZE:
+                self._store.popitem(last=False)
+                self._evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get aggregate hit/miss counts and hit ratio"""
+        with self._lock:
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'evictions': evictions,
+            'hit_ratio': hits / total if total else 0.0
+        }
 
 class ScopeDetector:
     """Detects scope of testing required based on Jira Ticket"""
@@ -36,7 +115,8 @@ class TestRepoAnalyzer:
         
     def analyze_existing_tests(self, ticket_key: str) -> Dict[str, Any]:
         files = self.client.list_test_files()
-        existing = [f for f in files if ticket_key.lower() in f.lower()]
+        key_lower = ticket_key.lower()
+        existing = [f for f in files if key_lower in f.lower()]
         return {
             "existing_test_files": existing,
             "has_existing_tests": len(existing) > 0,
@@ -46,60 +126,69 @@ class TestRepoAnalyzer:
     def suggest_update_strategy(self, existing_files, ticket_key, scope) -> Dict[str, str]:
         return {"action": "create" if not existing_files else "update", "recommendations": []}
 
-class TestFileNamingStrategy:
-    """Handles naming conventions for test files"""
+class TicketNamer:
+    """Builds test file paths for the scenarios of a single ticket"""
     
-    def generate_test_file_path(self, ticket: JiraTicket, scenario: Dict[str, Any], test_type: str) -> str:
-        """
-        MODIFIED: Generates a path based on Parent/Jira ID nesting: 
-        tests/e2e/<parent jira id>/<parent jira id>/<jira id>-<scenario id>.spec.ts
-        """
-        current_key = ticket.key.lower()
+    def __init__(self, ticket: JiraTicket):
+        self.current_key = ticket.key.lower()
         
         # Determine parent key for nesting. Use current key if no explicit parent is set.
         # This creates the desired path structure (e.g., QEA-18/QEA-18).
-        parent_key = ticket.parent_key.lower() if ticket.parent_key else current_key
+        self.parent_key = ticket.parent_key.lower() if ticket.parent_key else self.current_key
         
+        # Construct the requested nested folder structure: <parent>/<parent>/
+        # The filename itself includes the current ticket key, e.g., qea-20-ts-001.spec.ts
+        self.file_prefix = f"tests/e2e/{self.parent_key}/{self.parent_key}/{self.current_key}-"
+    
+    def path_for(self, scenario: Dict[str, Any]) -> str:
+        """Get the test file path for one scenario of this ticket"""
         # Get scenario ID, default to a random string if not present
         scenario_id_raw = scenario.get('id')
         if not scenario_id_raw:
-            scenario_id_raw = f"scenario-{hashlib.md5(scenario.get('title','').encode()).hexdigest()[:6]}"
+            scenario_id_raw = f"scenario-{_short_hash(scenario.get('title', ''))}"
 
         # Sanitize ID (e.g., "TS-001" -> "ts-001")
-        clean_scenario_id = str(scenario_id_raw).lower().replace(" ", "-").replace("_", "-")
+        clean_scenario_id = _clean_scenario_id(str(scenario_id_raw))
 
-        # Construct the requested nested folder structure: <parent>/<parent>/
-        file_path_prefix = f"tests/e2e/{parent_key}/{parent_key}"
-        
-        # The filename itself includes the current ticket key and scenario ID
-        # e.g., qea-20-ts-001.spec.ts
-        filename = f"{current_key}-{clean_scenario_id}.spec.ts"
+        return f"{self.file_prefix}{clean_scenario_id}.spec.ts"
 
-        return f"{file_path_prefix}/{filename}"
+class TestFileNamingStrategy:
+    """Handles naming conventions for test files"""
+    
+    def for_ticket(self, ticket: JiraTicket) -> TicketNamer:
+        """
+        Get a namer with the ticket-level parts of the path precomputed,
+        for naming many scenarios of the same ticket
+        """
+        return TicketNamer(ticket)
+    
+    def generate_test_file_path(self, ticket: JiraTicket, scenario: Dict[str, Any], test_type: str) -> str:
+        """
+        MODIFIED: Generates a path based on Parent/Jira ID nesting: 
+        tests/e2e/<parent jira id>/<parent jira id>/<jira id>-<scenario id>.spec.ts
+        """
+        return TicketNamer(ticket).path_for(scenario)
     
     def generate_unique_filename(self, base_path: str, existing_files: List[str]) -> str:
         """
         FIXED: Robustly handles name clashes by incrementing a counter.
         """
-        if base_path not in existing_files:
+        existing = set(existing_files)
+        if base_path not in existing:
             return base_path
         
         # Separate name and extension
-        # This handles complex extensions like .spec.ts
-        parts = base_path.rsplit('.', 2)
-        if len(parts) == 3 and parts[1] == 'spec': # Handle .spec.ts
-            base_name = parts[0]
-            extension = f".{parts[1]}.{parts[2]}"
+        # This handles complex extensions like .spec.ts as well as .ts, .js
+        match = _SPEC_EXT_RE.match(base_path)
+        if match:
+            base_name, extension = match.group(1), match.group(2)
         else:
-            # Handle simple extensions like .ts, .js
-            parts = base_path.rsplit('.', 1)
-            base_name = parts[0] if len(parts) > 1 else base_path
-            extension = f".{parts[1]}" if len(parts) > 1 else ""
+            base_name, extension = base_path, ""
 
         i = 1
         new_path = f"{base_name}-{i}{extension}"
         
-        while new_path in existing_files:
+        while new_path in existing:
             i += 1
             new_path = f"{base_name}-{i}{extension}"
             
@@ -108,7 +197,37 @@ class TestFileNamingStrategy:
 class LocatorExtractor:
     """Extracts data-testid and ids from codebase"""
     def extract_from_codebase(self, github_client: GitHubClient, codebase_analysis) -> Dict[str, List[str]]:
-        locators = {"data-testid": [], "id": []}
-        # Basic implementation: scan changed files for pattern
-        # Real implementation would use AST or Regex on file content
-        return locators
\ No newline at end of file
+        # Ordered de-duplication via dict keys
+        test_ids: Dict[str, None] = {}
+        ids: Dict[str, None] = {}
+        
+        try:
+            paths = [
+                path for path in map(_changed_file_path, codebase_analysis.files_changed or [])
+                if isinstance(path, str) and path.endswith(_UI_EXTENSIONS)
+            ]
+            if not paths:
+                return {"data-testid": [], "id": []}
+            
+            # Cached content is text already, so it is scanned as str
+            contents = github_client.get_cached_file_contents(
+                branch=codebase_analysis.branch,
+                file_paths=paths
+            )
+        except Exception as e:
+            logger.warning(f"Could not extract locators from cached files: {e}")
+            return {"data-testid": [], "id": []}
+        
+        for content in contents.values():
+            if not content:
+                continue
+            for test_id, element_id in _LOCATOR_RE.findall(content):
+                if test_id:
+                    test_ids[test_id] = None
+                else:
+                    ids[element_id] = None
+        
+        return {"data-testid": list(test_ids), "id": list(ids)}
+
+
+__all__ = ['CacheManager', 'ScopeDetector', 'TestRepoAnalyzer', 'TicketNamer', 'TestFileNamingStrategy', 'LocatorExtractor']
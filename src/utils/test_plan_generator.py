@@ -2,27 +2,174 @@
 # Test Plan Document Generator
 # ==============================================
 
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Optional, BinaryIO, AbstractSet
+from collections import Counter
+from datetime import date, datetime
+from contextlib import contextmanager, suppress
+import dataclasses
+import hashlib
+import json
 import os
 from pathlib import Path
 import tempfile
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+import threading
+import time
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
 
 from src.models.test_plan_models import TestPlan
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Test Scenarios sheet layout
+_SCENARIO_HEADERS = ['ID', 'Title', 'Priority', 'Type', 'Given', 'When', 'Then']
+_SCENARIO_COL_WIDTHS = (12, 35, 10, 10, 30, 30, 30)
+# Pulls one scenario's cells, in header order, as a tuple
+_SCENARIO_GETTER = itemgetter('id', 'title', 'priority', 'test_type', 'given', 'when', 'then')
+
+# Output files are written through a 1 MiB buffer rather than the 8 KiB default
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Generated documents are named by content and reused. By default they are kept
+# in a dedicated subdirectory of the system temp dir; once its documents exceed
+# this size, the least recently used ones are removed
+_CACHE_DIR_NAME = 'test_plan_cache'
+_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_CACHE_SUFFIXES = ('.pdf', '.xlsx')
+# Documents touched this recently may still be uploading for another request,
+# so pruning never removes them
+_CACHE_MIN_AGE_SECONDS = 10 * 60
+
+
+def _plan_digest(test_plan: TestPlan, jira_ticket_key: str, generated_on: date) -> str:
+    """
+    Stable hash of everything rendered into a test plan document, used in the
+    generated filenames. The generation date is part of the key, so a reused
+    document always shows the same date as a freshly generated one; the
+    trade-off is that documents show the date only, not the time of day
+    """
+    payload = json.dumps(
+        [jira_ticket_key, generated_on.isoformat(), dataclasses.asdict(test_plan)],
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+@contextmanager
+def _atomic_output(filepath: str):
+    """
+    Open a buffered temp file that replaces filepath only once fully written,
+    so a concurrent request never reuses a half-written document
+    """
+    tmp_path = f"{filepath}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as fh:
+            yield fh
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _reuse_cached(filepath: str) -> bool:
+    """Check for an already generated document, marking it recently used"""
+    try:
+        os.utime(filepath)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+# reportlab, openpyxl and pyexcelerate are heavy imports that most workers never
+# need, so each is imported on first use and cached for the life of the process
+
+@lru_cache(maxsize=None)
+def _load_reportlab() -> SimpleNamespace:
+    """Import reportlab and build the constant PDF styles"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.enums import TA_CENTER
+
+    styles = getSampleStyleSheet()
+
+    return SimpleNamespace(
+        SimpleDocTemplate=SimpleDocTemplate,
+        Table=Table,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        letter=letter,
+        inch=inch,
+        body_style=styles['BodyText'],
+        title_style=ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a1a1a'),
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        heading_style=ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#2c5aa0'),
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        overview_table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey)
+        ]),
+        scenario_table_style=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey)
+        ]),
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_openpyxl() -> SimpleNamespace:
+    """Import the openpyxl pieces used by the fallback Excel writer"""
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    # Style objects are immutable, so one instance of each is shared by every cell
+    return SimpleNamespace(
+        Workbook=openpyxl.Workbook,
+        WriteOnlyCell=WriteOnlyCell,
+        get_column_letter=get_column_letter,
+        title_font=Font(name='Calibri', size=14, bold=True),
+        bold_font=Font(bold=True),
+        header_font=Font(name='Calibri', size=12, bold=True, color='FFFFFF'),
+        header_fill=PatternFill(start_color='2C5AA0', end_color='2C5AA0', fill_type='solid'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_pyexcelerate():
+    """Import pyexcelerate, or return None if it is not installed"""
+    try:
+        import pyexcelerate
+    except ImportError:
+        return None
+    return pyexcelerate
+
 class TestPlanDocumentGenerator:
     """
     Generate test plan documents in PDF and Excel formats
@@ -33,211 +180,283 @@ class TestPlanDocumentGenerator:
         Initialize document generator
         
         Args:
-            output_dir: Directory for generated documents (default: system temp)
+            output_dir: Directory for generated documents, pruned as a cache, so it
+                should not be shared with other files (default: a test_plan_cache
+                subdirectory of the system temp dir)
         """
         if output_dir:
             self.output_dir = Path(output_dir)
-            self.output_dir.mkdir(exist_ok=True)
         else:
-            self.output_dir = Path(tempfile.gettempdir())
+            self.output_dir = Path(tempfile.gettempdir()) / _CACHE_DIR_NAME
+        self.output_dir.mkdir(exist_ok=True)
         
         logger.info(f"Test plan document generator initialized at {self.output_dir}")
 
-    def generate_pdf(self, test_plan: TestPlan, jira_ticket_key: str) -> str:
+    def generate_pdf(self, test_plan: TestPlan, jira_ticket_key: str, now: Optional[datetime] = None) -> str:
         """
         Generate PDF test plan document
 
         Args:
             test_plan: TestPlan object
             jira_ticket_key: Jira ticket key
+            now: Generation date shown in the overview (default: today)
 
         Returns:
             Path to generated PDF file
         """
-        filename = f"TestPlan_{jira_ticket_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        filepath = self.output_dir / filename
+        now = now or datetime.now()
+        filepath = self._render_pdf(
+            test_plan, jira_ticket_key, now, _plan_digest(test_plan, jira_ticket_key, now.date())
+        )
+        self._prune_cache(keep={filepath})
+        return filepath
+
+    def _render_pdf(self, test_plan: TestPlan, jira_ticket_key: str, now: datetime, digest: str) -> str:
+        """Generate the PDF document for a plan digest, or reuse the one already generated"""
+        filename = f"TestPlan_{jira_ticket_key}_{digest}.pdf"
+        # Converted once; used for opening, logging and the return value
+        filepath = os.fspath(self.output_dir / filename)
+
+        if _reuse_cached(filepath):
+            logger.info(f"Reusing generated PDF test plan: {filepath}")
+            return filepath
 
         logger.info(f"Generating PDF test plan: {filename}")
 
         try:
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=letter,
-                rightMargin=0.75*inch,
-                leftMargin=0.75*inch,
-                topMargin=1*inch,
-                bottomMargin=0.75*inch
-            )
-
+            rl = _load_reportlab()
+            Paragraph, Spacer, Table, inch = rl.Paragraph, rl.Spacer, rl.Table, rl.inch
+            heading_style = rl.heading_style
             elements = []
-            styles = getSampleStyleSheet()
 
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1a1a1a'),
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            elements.append(Paragraph(f"Test Plan: {jira_ticket_key}", title_style))
+            elements.append(Paragraph(f"Test Plan: {jira_ticket_key}", rl.title_style))
             elements.append(Spacer(1, 0.2*inch))
 
             # Overview section
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=16,
-                textColor=colors.HexColor('#2c5aa0'),
-                spaceAfter=12,
-                spaceBefore=12
-            )
-
             elements.append(Paragraph("Test Plan Overview", heading_style))
 
             overview_data = [
                 ['Jira Ticket', jira_ticket_key],
-                ['Generated Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+                ['Generated Date', now.strftime('%Y-%m-%d')],
                 ['Test Approach', test_plan.test_approach],
                 ['Total Scenarios', str(len(test_plan.test_scenarios))],
                 ['Confidence Score', f"{test_plan.confidence_score}%"]
             ]
 
             overview_table = Table(overview_data, colWidths=[2*inch, 4*inch])
-            overview_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-            ]))
+            overview_table.setStyle(rl.overview_table_style)
             elements.append(overview_table)
             elements.append(Spacer(1, 0.3*inch))
 
             # Test Strategy
             elements.append(Paragraph("Test Strategy", heading_style))
-            elements.append(Paragraph(test_plan.strategy, styles['BodyText']))
+            elements.append(Paragraph(test_plan.strategy, rl.body_style))
             elements.append(Spacer(1, 0.3*inch))
 
             # Test Scenarios Summary
             elements.append(Paragraph("Test Scenarios Summary", heading_style))
             
-            scenario_types = {}
-            for scenario in test_plan.test_scenarios:
-                test_type = scenario.get('test_type', 'Unknown')
-                scenario_types[test_type] = scenario_types.get(test_type, 0) + 1
-            
-            scenario_data = [['Test Type', 'Count']]
-            for test_type, count in scenario_types.items():
-                scenario_data.append([test_type, str(count)])
-
-            scenario_table = Table(scenario_data, colWidths=[3*inch, 1*inch])
-            scenario_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-            ]))
-            elements.append(scenario_table)
-
-            # Build PDF
-            doc.build(elements)
+            if not test_plan.test_scenarios:
+                # Nothing to summarize; skip the empty table layout
+                elements.append(Paragraph("No scenarios defined.", rl.body_style))
+            else:
+                # Counter keeps first-seen order, so rows appear as before
+                scenario_types = Counter(
+                    scenario.get('test_type', 'Unknown') for scenario in test_plan.test_scenarios
+                )
+                
+                scenario_data = [['Test Type', 'Count']]
+                for test_type, count in scenario_types.items():
+                    scenario_data.append([test_type, str(count)])
+
+                scenario_table = Table(scenario_data, colWidths=[3*inch, 1*inch])
+                scenario_table.setStyle(rl.scenario_table_style)
+                elements.append(scenario_table)
+
+            # Create and build PDF document
+            with _atomic_output(filepath) as fh:
+                doc = rl.SimpleDocTemplate(
+                    fh,
+                    pagesize=rl.letter,
+                    rightMargin=0.75*inch,
+                    leftMargin=0.75*inch,
+                    topMargin=1*inch,
+                    bottomMargin=0.75*inch
+                )
+                doc.build(elements)
             logger.info(f"PDF test plan generated successfully: {filepath}")
 
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             logger.error(f"Failed to generate PDF test plan: {str(e)}")
             raise
 
-    def generate_excel(self, test_plan: TestPlan, jira_ticket_key: str) -> str:
+    def generate_excel(self, test_plan: TestPlan, jira_ticket_key: str, now: Optional[datetime] = None) -> str:
         """
         Generate Excel test plan workbook
 
         Args:
             test_plan: TestPlan object
             jira_ticket_key: Jira ticket key
+            now: Generation date shown in the overview (default: today)
 
         Returns:
             Path to generated Excel file
         """
-        filename = f"TestPlan_{jira_ticket_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        filepath = self.output_dir / filename
+        now = now or datetime.now()
+        filepath = self._render_excel(
+            test_plan, jira_ticket_key, now, _plan_digest(test_plan, jira_ticket_key, now.date())
+        )
+        self._prune_cache(keep={filepath})
+        return filepath
+
+    def _render_excel(self, test_plan: TestPlan, jira_ticket_key: str, now: datetime, digest: str) -> str:
+        """Generate the Excel workbook for a plan digest, or reuse the one already generated"""
+        filename = f"TestPlan_{jira_ticket_key}_{digest}.xlsx"
+        # Converted once; used for opening, logging and the return value
+        filepath = os.fspath(self.output_dir / filename)
+
+        if _reuse_cached(filepath):
+            logger.info(f"Reusing generated Excel test plan: {filepath}")
+            return filepath
 
         logger.info(f"Generating Excel test plan: {filename}")
 
         try:
-            # Create workbook
-            wb = openpyxl.Workbook()
-            
-            # Overview sheet
-            ws = wb.active
-            ws.title = "Overview"
-            
-            # Add header
-            header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='2C5AA0', end_color='2C5AA0', fill_type='solid')
-            
-            ws['A1'] = f"Test Plan: {jira_ticket_key}"
-            ws['A1'].font = Font(name='Calibri', size=14, bold=True)
-            
-            # Add overview data
+            title = f"Test Plan: {jira_ticket_key}"
             overview_data = [
                 ['Jira Ticket', jira_ticket_key],
-                ['Generated Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+                ['Generated Date', now.strftime('%Y-%m-%d')],
                 ['Test Approach', test_plan.test_approach],
                 ['Total Scenarios', len(test_plan.test_scenarios)],
                 ['Confidence Score', f"{test_plan.confidence_score}%"],
                 ['Strategy', test_plan.strategy]
             ]
-            
-            for row_idx, (key, value) in enumerate(overview_data, 3):
-                ws.cell(row=row_idx, column=1, value=key).font = Font(bold=True)
-                ws.cell(row=row_idx, column=2, value=value)
-            
-            # Test Scenarios sheet
-            ws_scenarios = wb.create_sheet("Test Scenarios")
-            
-            headers = ['ID', 'Title', 'Priority', 'Type', 'Given', 'When', 'Then']
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws_scenarios.cell(row=1, column=col_idx, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-            
-            # Add scenarios
-            for row_idx, scenario in enumerate(test_plan.test_scenarios, 2):
-                ws_scenarios.cell(row=row_idx, column=1, value=scenario['id'])
-                ws_scenarios.cell(row=row_idx, column=2, value=scenario['title'])
-                ws_scenarios.cell(row=row_idx, column=3, value=scenario['priority'])
-                ws_scenarios.cell(row=row_idx, column=4, value=scenario['test_type'])
-                ws_scenarios.cell(row=row_idx, column=5, value=scenario['given'])
-                ws_scenarios.cell(row=row_idx, column=6, value=scenario['when'])
-                ws_scenarios.cell(row=row_idx, column=7, value=scenario['then'])
-            
-            # Adjust column widths
-            ws_scenarios.column_dimensions['A'].width = 12
-            ws_scenarios.column_dimensions['B'].width = 35
-            ws_scenarios.column_dimensions['C'].width = 10
-            ws_scenarios.column_dimensions['D'].width = 10
-            ws_scenarios.column_dimensions['E'].width = 30
-            ws_scenarios.column_dimensions['F'].width = 30
-            ws_scenarios.column_dimensions['G'].width = 30
-            
-            # Save workbook
-            wb.save(str(filepath))
+            scenario_rows = list(map(_SCENARIO_GETTER, test_plan.test_scenarios))
+
+            pyexcelerate = _load_pyexcelerate()
+            with _atomic_output(filepath) as fh:
+                if pyexcelerate is not None:
+                    self._write_excel_pyexcelerate(pyexcelerate, fh, title, overview_data, scenario_rows)
+                else:
+                    self._write_excel_openpyxl(fh, title, overview_data, scenario_rows)
+
             logger.info(f"Excel test plan generated successfully: {filepath}")
 
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             logger.error(f"Failed to generate Excel test plan: {str(e)}")
             raise
 
+    def _write_excel_pyexcelerate(self, pyexcelerate, fh: BinaryIO, title: str, overview_data: list, scenario_rows: list):
+        """Write the workbook with pyexcelerate (whole sheets passed as row lists)"""
+        wb = pyexcelerate.Workbook()
+
+        # Overview sheet: title in A1, data from row 3
+        ws = wb.new_sheet("Overview", data=[[title], [], *overview_data])
+        ws.set_cell_style(1, 1, pyexcelerate.Style(
+            font=pyexcelerate.Font(family='Calibri', size=14, bold=True)
+        ))
+        key_style = pyexcelerate.Style(font=pyexcelerate.Font(bold=True))
+        for row_idx in range(3, 3 + len(overview_data)):
+            ws.set_cell_style(row_idx, 1, key_style)
+
+        # Test Scenarios sheet
+        ws_scenarios = wb.new_sheet("Test Scenarios", data=[_SCENARIO_HEADERS, *scenario_rows])
+        header_style = pyexcelerate.Style(
+            font=pyexcelerate.Font(family='Calibri', size=12, bold=True, color=pyexcelerate.Color(255, 255, 255)),
+            fill=pyexcelerate.Fill(background=pyexcelerate.Color(0x2C, 0x5A, 0xA0))
+        )
+        for col_idx in range(1, len(_SCENARIO_HEADERS) + 1):
+            ws_scenarios.set_cell_style(1, col_idx, header_style)
+
+        # Adjust column widths
+        for col_idx, width in enumerate(_SCENARIO_COL_WIDTHS, 1):
+            ws_scenarios.set_col_style(col_idx, pyexcelerate.Style(size=width))
+
+        wb.save(fh)
+
+    def _write_excel_openpyxl(self, fh: BinaryIO, title: str, overview_data: list, scenario_rows: list):
+        """Write the workbook with openpyxl (used when pyexcelerate is not installed)"""
+        xl = _load_openpyxl()
+        WriteOnlyCell = xl.WriteOnlyCell
+        
+        # Write-only workbook: rows are streamed out as they are appended
+        wb = xl.Workbook(write_only=True)
+        
+        # Overview sheet
+        ws = wb.create_sheet("Overview")
+        
+        # Add header
+        title_cell = WriteOnlyCell(ws, value=title)
+        title_cell.font = xl.title_font
+        ws.append([title_cell])
+        ws.append([])
+        
+        # Add overview data
+        for key, value in overview_data:
+            key_cell = WriteOnlyCell(ws, value=key)
+            key_cell.font = xl.bold_font
+            ws.append([key_cell, value])
+        
+        # Test Scenarios sheet
+        ws_scenarios = wb.create_sheet("Test Scenarios")
+        
+        # Adjust column widths (must happen before the first row is written)
+        dims = ws_scenarios.column_dimensions
+        for col_idx, width in enumerate(_SCENARIO_COL_WIDTHS, 1):
+            dims[xl.get_column_letter(col_idx)].width = width
+        
+        header_cells = []
+        for header in _SCENARIO_HEADERS:
+            cell = WriteOnlyCell(ws_scenarios, value=header)
+            cell.font = xl.header_font
+            cell.fill = xl.header_fill
+            header_cells.append(cell)
+        ws_scenarios.append(header_cells)
+        
+        # Add scenarios, a whole row at a time
+        for row in scenario_rows:
+            ws_scenarios.append(row)
+        
+        # Save workbook
+        wb.save(fh)
+
+    def _prune_cache(self, keep: AbstractSet[str]):
+        """
+        Remove least recently used documents once the cache exceeds its size limit.
+        Paths in keep (the current request's documents) and documents touched
+        within the grace period are never removed
+        """
+        entries = []
+        total = 0
+        evict_before = time.time() - _CACHE_MIN_AGE_SECONDS
+        for path in self.output_dir.glob('TestPlan_*'):
+            if path.suffix not in _CACHE_SUFFIXES:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            total += st.st_size
+            if st.st_mtime < evict_before and os.fspath(path) not in keep:
+                entries.append((st.st_mtime, st.st_size, path))
+
+        if total <= _CACHE_MAX_BYTES:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= _CACHE_MAX_BYTES:
+                break
+            with suppress(OSError):
+                path.unlink()
+                logger.debug(f"Evicted cached test plan document: {path}")
+            total -= size
+
     def generate_both(self, test_plan: TestPlan, jira_ticket_key: str) -> Dict[str, str]:
         """
         Generate both PDF and Excel documents
@@ -251,8 +470,16 @@ class TestPlanDocumentGenerator:
         """
         logger.info(f"Generating both PDF and Excel test plans for {jira_ticket_key}")
         
-        pdf_path = self.generate_pdf(test_plan, jira_ticket_key)
-        excel_path = self.generate_excel(test_plan, jira_ticket_key)
+        # One timestamp and digest so both documents show the same generation date
+        now = datetime.now()
+        digest = _plan_digest(test_plan, jira_ticket_key, now.date())
+        
+        # Rendered one after the other: reportlab and openpyxl are pure Python and
+        # hold the GIL, so rendering them on two threads measured no faster
+        pdf_path = self._render_pdf(test_plan, jira_ticket_key, now, digest)
+        excel_path = self._render_excel(test_plan, jira_ticket_key, now, digest)
+        
+        self._prune_cache(keep={pdf_path, excel_path})
 
         return {
             'pdf': pdf_path,
@@ -1,8 +1,55 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 import json
+import sys
+
+# User-friendly messages by Pydantic error type, built once at import
+_MESSAGE_TEMPLATES = {
+    'string_too_short': "{field} cannot be empty",
+    'string_too_long': "{field} exceeds maximum length",
+    'missing': "{field} is required",
+    'greater_than': "{field} must be greater than {gt}",
+    'less_than_equal': "{field} must not exceed {le}",
+    'int_parsing': "{field} must be an integer",
+    'bool_parsing': "{field} must be true or false",
+    'string_pattern': "{field} has invalid format",
+}
+# Error types whose template reads values from the error's ctx
+_CTX_ERROR_TYPES = frozenset({'greater_than', 'less_than_equal'})
+
+
+def _format_error(error: dict) -> dict:
+    """Convert a single Pydantic error entry to the response format"""
+    loc = error['loc']
+    field = loc[-1] if loc else 'unknown'
+    if type(field) is str:
+        # Batch requests repeat the same field names; share one copy of each
+        field = sys.intern(field)
+    error_type = error['type']
+    msg = error.get('msg')
+    
+    if error_type == 'value_error':
+        # Custom validation errors from @field_validator carry their own message
+        message = msg if msg is not None else f"Invalid value for {field}"
+    else:
+        # Use custom message or default Pydantic message
+        template = _MESSAGE_TEMPLATES.get(error_type)
+        if template is None:
+            message = msg if msg is not None else f"Invalid {field}"
+        elif error_type in _CTX_ERROR_TYPES:
+            ctx = error.get('ctx') or {}
+            message = template.format(field=field, gt=ctx.get('gt', 0), le=ctx.get('le', 100))
+        else:
+            message = template.format(field=field)
+    
+    return {
+        'field': field,
+        'message': message,
+        'type': error_type
+    }
+
 
 def format_validation_errors(exc: RequestValidationError) -> dict:
     """
@@ -14,44 +61,11 @@ def format_validation_errors(exc: RequestValidationError) -> dict:
     Returns:
         Dictionary with custom error messages
     """
-    errors = []
-    
-    for error in exc.errors():
-        field = error['loc'][-1] if error['loc'] else 'unknown'
-        error_type = error['type']
-        
-        # Map error types to user-friendly messages
-        message_map = {
-            'string_too_short': f"{field} cannot be empty",
-            'string_too_long': f"{field} exceeds maximum length",
-            'value_error': error.get('msg', f"Invalid value for {field}"),
-            'missing': f"{field} is required",
-            'greater_than': f"{field} must be greater than {error.get('ctx', {}).get('gt', 0)}",
-            'less_than_equal': f"{field} must not exceed {error.get('ctx', {}).get('le', 100)}",
-            'int_parsing': f"{field} must be an integer",
-            'bool_parsing': f"{field} must be true or false",
-            'string_pattern': f"{field} has invalid format",
-        }
-        
-        # Use custom message or default Pydantic message
-        message = message_map.get(error_type, error.get('msg', f"Invalid {field}"))
-        
-        # Add context-specific messages
-        if error_type == 'value_error' and 'ctx' in error:
-            # This is our custom validation error from @field_validator
-            message = error.get('msg', message)
-        
-        errors.append({
-            'field': field,
-            'message': message,
-            'type': error_type
-        })
-    
     return {
         'status': 'error',
         'code': 'VALIDATION_ERROR',
         'message': 'Request validation failed',
-        'details': errors
+        'details': [_format_error(error) for error in exc.errors()]
     }
 
 
@@ -66,11 +80,11 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         exc: RequestValidationError
         
     Returns:
-        JSONResponse with HTTP 400
+        ORJSONResponse with HTTP 400
     """
     error_response = format_validation_errors(exc)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,  # Use 400 instead of 422
         content=error_response
     )
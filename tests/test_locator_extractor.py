@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("github")
+pytest.importorskip("requests")
+
+from src.utils.test_generation_utils import LocatorExtractor
+
+
+def _analysis(files_changed):
+    return SimpleNamespace(branch="main", files_changed=files_changed)
+
+
+def test_extract_accepts_str_dict_and_object_entries():
+    client = MagicMock()
+    client.get_cached_file_contents.return_value = {
+        "src/App.tsx": '<button data-testid="submit-btn" id="submit">',
+        "src/Login.vue": "<input id='username'>",
+        "src/index.html": '<div data-testid="root">',
+    }
+    files_changed = [
+        "src/App.tsx",
+        {"path": "src/Login.vue"},
+        SimpleNamespace(path="src/index.html"),
+        {"status": "modified"},
+        SimpleNamespace(status="added"),
+        {"path": None},
+        42,
+        "README.md",
+    ]
+
+    locators = LocatorExtractor().extract_from_codebase(client, _analysis(files_changed))
+
+    client.get_cached_file_contents.assert_called_once_with(
+        branch="main",
+        file_paths=["src/App.tsx", "src/Login.vue", "src/index.html"],
+    )
+    assert locators == {"data-testid": ["submit-btn", "root"], "id": ["submit", "username"]}
+
+
+def test_extract_without_ui_paths_skips_cache_read():
+    client = MagicMock()
+
+    locators = LocatorExtractor().extract_from_codebase(
+        client, _analysis([{"status": "modified"}, "README.md"])
+    )
+
+    client.get_cached_file_contents.assert_not_called()
+    assert locators == {"data-testid": [], "id": []}